@@ -5,14 +5,17 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QStackedWidget, QLabel, QFormLayout, 
     QLineEdit, QComboBox
 )
-from PyQt6.QtCore import pyqtSlot
-import copy
+from PyQt6.QtCore import pyqtSlot, QTimer
+from ast import literal_eval
 from typing import Any
 from services.command_history_service import command_history_service
 # FIX: Removed unused MoveChildCommand import
 from services.commands import UpdateChildPropertiesCommand
 from typing import Any, Optional
 
+# Accepted spellings for a "true" boolean property value.
+_TRUE = frozenset(('true', '1', 't', 'y', 'yes'))
+
 class PropertyEditor(QStackedWidget):
     """
     A widget that displays a property editor for the currently selected object.
@@ -24,6 +27,30 @@ class PropertyEditor(QStackedWidget):
         self.current_parent_id = None
         self.current_properties = {}
 
+        # Coalesce bursts of editingFinished/currentIndexChanged signals into
+        # a single commit per event-loop turn instead of one per field.
+        self._pending_commit = None
+        self._commit_timer = QTimer(self)
+        self._commit_timer.setSingleShot(True)
+        self._commit_timer.setInterval(0)
+        self._commit_timer.timeout.connect(self._flush_pending)
+
+        # Cache one editor widget per object type so selection changes rebind
+        # field contents instead of destroying and rebuilding widgets.
+        self._editor_cache = {}
+        # Rebind callback of the editor currently shown, used to refresh the
+        # same object in place after undo/redo or command round-trips.
+        self._active_rebind = None
+
+        # O(1) dispatch from object type to editor factory.
+        self._editor_factories = {
+            'button': self._create_button_editor,
+            'rectangle': self._create_generic_editor,
+            'circle': self._create_generic_editor,
+            'polygon': self._create_generic_editor,
+            'text': self._create_generic_editor,
+        }
+
         # --- Create Pages ---
         self.blank_page = QWidget()
         self.blank_page_layout = QVBoxLayout(self.blank_page)
@@ -38,22 +65,37 @@ class PropertyEditor(QStackedWidget):
 
         self.setCurrentWidget(self.blank_page)
 
+    def _schedule_commit(self, commit):
+        """Queues a commit callback to run once the current signal burst ends."""
+        self._pending_commit = commit
+        self._commit_timer.start()
+
+    def _flush_pending(self):
+        """Runs the queued commit callback, if any."""
+        commit, self._pending_commit = self._pending_commit, None
+        if commit is not None:
+            commit()
+
     @pyqtSlot(str, object)
     def set_current_object(self, parent_id: Optional[str], selection_data: Any) -> None:
         """
         Sets the currently selected object(s) to be edited.
         """
-        # Clear previous editor if it exists
-        if self.count() > 2:
-            old_widget = self.widget(2)
-            if old_widget is not None:
-                self.removeWidget(old_widget)
-                old_widget.deleteLater()
+        # Flush any debounced edit while the outgoing object's ids and
+        # properties are still current; once they are re-pointed below,
+        # a pending commit would read (and write) the new object's state.
+        if self._pending_commit is not None:
+            self._commit_timer.stop()
+            self._flush_pending()
+
+        prev_id = self.current_object_id
+        prev_parent_id = self.current_parent_id
 
         if not selection_data:
             self.setCurrentWidget(self.blank_page)
             self.current_object_id = None
             self.current_parent_id = None
+            self._active_rebind = None
             return
 
         if isinstance(selection_data, list):
@@ -61,6 +103,7 @@ class PropertyEditor(QStackedWidget):
                 self.setCurrentWidget(self.multi_select_page)
                 self.current_object_id = None
                 self.current_parent_id = None
+                self._active_rebind = None
                 return
             elif len(selection_data) == 1:
                 selection_data = {'instance_id': selection_data[0]}
@@ -68,6 +111,7 @@ class PropertyEditor(QStackedWidget):
                 self.setCurrentWidget(self.blank_page)
                 self.current_object_id = None
                 self.current_parent_id = None
+                self._active_rebind = None
                 return
 
         elif isinstance(selection_data, str):
@@ -80,46 +124,66 @@ class PropertyEditor(QStackedWidget):
             # This is an embedded screen, which has different properties
             # For now, show a placeholder
             self.setCurrentWidget(self.blank_page)
+            self._active_rebind = None
         elif 'type' in selection_data:
             self.current_properties = selection_data.get('properties', {})
             object_type = selection_data.get('type')
-            
-            editor = None
-            if object_type == 'button':
-                editor = self._create_button_editor()
-            elif object_type in ['rectangle', 'circle', 'polygon', 'text']:
-                editor = self._create_generic_editor()
-
-            if editor:
-                self.addWidget(editor)
-                self.setCurrentWidget(editor)
-            else:
+
+            # Same object re-selected (undo/redo, command round-trip): just
+            # refresh the visible editor's field values in place.
+            if (
+                self.current_object_id == prev_id
+                and parent_id == prev_parent_id
+                and self._active_rebind is not None
+            ):
+                self._active_rebind()
+                return
+
+            factory = self._editor_factories.get(object_type)
+            if factory is None:
                 self.setCurrentWidget(self.blank_page)
+                self._active_rebind = None
+            else:
+                if object_type == 'button':
+                    cache_key = 'button'
+                else:
+                    # Generic editors are shared between objects with the same
+                    # property schema, so key on the sorted property names.
+                    cache_key = 'generic:' + ','.join(sorted(self.current_properties))
+                cached = self._editor_cache.get(cache_key)
+                if cached is None:
+                    cached = factory()
+                    self._editor_cache[cache_key] = cached
+                    self.addWidget(cached[0])
+                editor, rebind = cached
+                rebind()
+                self._active_rebind = rebind
+                self.setCurrentWidget(editor)
         else:
             self.setCurrentWidget(self.blank_page)
+            self._active_rebind = None
 
 
     def _create_button_editor(self):
-        """Creates a property editor widget specifically for buttons."""
+        """Creates a button property editor and its rebind callback."""
         from tools import button_styles
         editor_widget = QWidget()
         layout = QFormLayout(editor_widget)
         layout.setContentsMargins(5, 5, 5, 5)
         layout.setSpacing(5)
 
-        label_edit = QLineEdit(self.current_properties.get("label", ""))
+        label_edit = QLineEdit()
         style_combo = QComboBox()
+        # Fetch the style table once and index it by id so the edit callback
+        # never has to rescan the style list.
         styles = button_styles.get_styles()
+        styles_by_id = {style['id']: style for style in styles}
+        default_style = styles[0]
         for style in styles:
             style_combo.addItem(style['name'], style['id'])
-        
-        current_style_id = self.current_properties.get("style_id", "default_rounded")
-        index = style_combo.findData(current_style_id)
-        if index != -1:
-            style_combo.setCurrentIndex(index)
-        
-        bg_color_edit = QLineEdit(self.current_properties.get("background_color", ""))
-        text_color_edit = QLineEdit(self.current_properties.get("text_color", ""))
+
+        bg_color_edit = QLineEdit()
+        text_color_edit = QLineEdit()
 
         layout.addRow("Label:", label_edit)
         layout.addRow("Style:", style_combo)
@@ -127,38 +191,65 @@ class PropertyEditor(QStackedWidget):
         layout.addRow("Text Color:", text_color_edit)
 
         def on_property_changed():
-            new_props = copy.deepcopy(self.current_properties)
+            current = self.current_properties
+            selected_style_id = style_combo.currentData()
+            style_changed = selected_style_id != current.get('style_id')
+
+            # Detect the no-op case (e.g. tabbing through fields) before
+            # allocating a copy or touching the command history.
+            if (not style_changed
+                    and label_edit.text() == current.get("label", "")
+                    and bg_color_edit.text() == current.get("background_color", "")
+                    and text_color_edit.text() == current.get("text_color", "")):
+                return
+
+            # Properties are flat scalar values, so a shallow copy is enough
+            # and avoids deepcopy overhead on every edit commit.
+            new_props = current.copy()
             new_props["label"] = label_edit.text()
             new_props["background_color"] = bg_color_edit.text()
             new_props["text_color"] = text_color_edit.text()
-            
-            selected_style_id = style_combo.currentData()
-            if selected_style_id != new_props.get('style_id'):
+
+            if style_changed:
                 new_props['style_id'] = selected_style_id
-                style_def = button_styles.get_style_by_id(selected_style_id)
+                style_def = styles_by_id.get(selected_style_id, default_style)
                 new_props.update(style_def['properties'])
                 # Update UI to reflect style change
                 bg_color_edit.setText(new_props['background_color'])
                 text_color_edit.setText(new_props['text_color'])
 
-            if new_props != self.current_properties:
+            if new_props != current:
                 command = UpdateChildPropertiesCommand(
-                    self.current_parent_id, 
-                    self.current_object_id, 
-                    new_props, 
-                    self.current_properties
+                    self.current_parent_id,
+                    self.current_object_id,
+                    new_props,
+                    current
                 )
                 command_history_service.add_command(command)
         
-        label_edit.editingFinished.connect(on_property_changed)
-        style_combo.currentIndexChanged.connect(on_property_changed)
-        bg_color_edit.editingFinished.connect(on_property_changed)
-        text_color_edit.editingFinished.connect(on_property_changed)
+        def schedule():
+            self._schedule_commit(on_property_changed)
+
+        label_edit.editingFinished.connect(schedule)
+        style_combo.currentIndexChanged.connect(schedule)
+        bg_color_edit.editingFinished.connect(schedule)
+        text_color_edit.editingFinished.connect(schedule)
+
+        def rebind():
+            properties = self.current_properties
+            style_combo.blockSignals(True)
+            label_edit.setText(properties.get("label", ""))
+            index = style_combo.findData(properties.get("style_id", "default_rounded"))
+            if index != -1:
+                style_combo.setCurrentIndex(index)
+            bg_color_edit.setText(properties.get("background_color", ""))
+            text_color_edit.setText(properties.get("text_color", ""))
+            style_combo.blockSignals(False)
 
-        return editor_widget
+        return editor_widget, rebind
 
     def _create_generic_editor(self):
-        """Creates a generic property editor for drawing objects."""
+        """Creates a generic property editor and its rebind callback."""
         editor_widget = QWidget()
         layout = QFormLayout(editor_widget)
         layout.setContentsMargins(5, 5, 5, 5)
@@ -166,39 +257,59 @@ class PropertyEditor(QStackedWidget):
 
         property_widgets = {}
 
+        # Each property's type is fixed by the schema the editor was built
+        # for, so pick a parser per field once instead of running an
+        # isinstance ladder on every commit.
+        def _parse_bool(s):
+            return s.strip().lower() in _TRUE
+
+        def _parse_int(s):
+            return int(s.strip())
+
+        def _parse_float(s):
+            return float(s.strip())
+
+        parsers = []
         for key, value in self.current_properties.items():
-            line_edit = QLineEdit(str(value))
+            line_edit = QLineEdit()
             layout.addRow(key.replace("_", " ").title() + ":", line_edit)
             property_widgets[key] = line_edit
 
+            if isinstance(value, bool):
+                parser = _parse_bool
+            elif isinstance(value, int):
+                parser = _parse_int
+            elif isinstance(value, float):
+                parser = _parse_float
+            elif isinstance(value, list):
+                # literal_eval only parses literals, so no arbitrary
+                # code execution and no full expression compilation.
+                parser = literal_eval
+            else:
+                parser = str
+            parsers.append((key, line_edit, parser))
+
         def on_property_changed():
-            new_props = copy.deepcopy(self.current_properties)
-            changed = False
-            for key, widget in property_widgets.items():
-                new_value_str = widget.text()
+            # Collect the diffs first; only allocate the new property dict
+            # (and a command) if at least one value actually changed.
+            diffs = []
+            for key, widget, parser in parsers:
                 old_value = self.current_properties.get(key)
-                
                 try:
-                    if isinstance(old_value, bool):
-                        new_value = new_value_str.lower() in ['true', '1', 't', 'y', 'yes']
-                    elif isinstance(old_value, int):
-                        new_value = int(new_value_str)
-                    elif isinstance(old_value, float):
-                        new_value = float(new_value_str)
-                    elif isinstance(old_value, list):
-                        # Use eval for lists, it's risky but simple for this context
-                        new_value = eval(new_value_str)
-                    else:
-                        new_value = new_value_str
-                except (ValueError, SyntaxError, NameError):
+                    new_value = parser(widget.text())
+                except (ValueError, SyntaxError):
                     # If conversion fails, revert to old value and skip update for this key
                     new_value = old_value
 
-                if new_props.get(key) != new_value:
-                    new_props[key] = new_value
-                    changed = True
+                if old_value != new_value:
+                    diffs.append((key, new_value))
 
-            if changed:
+            if diffs:
+                new_props = self.current_properties.copy()
+                for key, new_value in diffs:
+                    # Clone list values so the old and new property dicts
+                    # never share a mutable entry.
+                    new_props[key] = list(new_value) if isinstance(new_value, list) else new_value
                 command = UpdateChildPropertiesCommand(
                     self.current_parent_id,
                     self.current_object_id,
@@ -210,7 +321,15 @@ class PropertyEditor(QStackedWidget):
                 # but for immediate UI consistency, we can update it here too.
                 self.current_properties = new_props
 
+        def schedule():
+            self._schedule_commit(on_property_changed)
+
         for widget in property_widgets.values():
-            widget.editingFinished.connect(on_property_changed)
+            widget.editingFinished.connect(schedule)
+
+        def rebind():
+            properties = self.current_properties
+            for key, widget in property_widgets.items():
+                widget.setText(str(properties.get(key, "")))
 
-        return editor_widget
+        return editor_widget, rebind
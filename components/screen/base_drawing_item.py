@@ -11,6 +11,10 @@ from components.screen.transform_handler import TransformHandler
 
 
 class BaseDrawingItem(QGraphicsItem):
+    # Shared hover decoration, built once instead of per paint call.
+    _HOVER_PEN = QPen(QColor("#888888"), 1, Qt.PenStyle.DashLine)
+    _HOVER_PEN.setCosmetic(True)
+
     def __init__(self):
         super().__init__()
         # Enable selecting, moving and geometry-change notifications
@@ -21,13 +25,16 @@ class BaseDrawingItem(QGraphicsItem):
         )
         self.setAcceptHoverEvents(True)
 
-        # Create a transform handler for resize/rotate handles
-        self.transform_handler = TransformHandler(self)
+        # Transform handler for resize/rotate handles, created lazily on
+        # first use so unselected items never pay for one.
+        self._transform_handler = None
 
         self._is_hovering = False
         self._is_transforming = False
         self._active_handle = None
         self._is_moving = False
+        self._last_pos = QPointF()
+        self._current_cursor_shape = Qt.CursorShape.ArrowCursor
 
         # Dictionary to store arbitrary properties
         self.properties = {}
@@ -35,6 +42,27 @@ class BaseDrawingItem(QGraphicsItem):
     # ------------------------------------------------------------------
     # Geometry helpers
     # ------------------------------------------------------------------
+    @property
+    def transform_handler(self) -> TransformHandler:
+        """Return the transform handler, creating it on first access."""
+        handler = self._transform_handler
+        if handler is None:
+            handler = self._transform_handler = TransformHandler(self)
+        return handler
+
+    def _view_scale(self) -> float:
+        """Return the current view scale factor (defaults to ``1.0``)."""
+        scene = self.scene()
+        if scene and scene.views():
+            return scene.views()[0].transform().m11() or 1.0
+        return 1.0
+
+    def _set_cursor(self, shape: Qt.CursorShape) -> None:
+        """Set the cursor only when the shape actually changes."""
+        if shape != self._current_cursor_shape:
+            self._current_cursor_shape = shape
+            self.setCursor(shape)
+
     def contentRect(self) -> QRectF:
         """Return the rectangle occupied by the item's actual content."""
         raise NotImplementedError
@@ -42,9 +70,12 @@ class BaseDrawingItem(QGraphicsItem):
     def boundingRect(self) -> QRectF:
         """Return bounding rect expanded to fit transform handles."""
         rect = QRectF(self.contentRect())
-        hs = self.transform_handler.handle_size
-        sp = self.transform_handler.handle_space
-        rot = self.transform_handler.rotation_offset
+        # Use the class-level base metrics so an unselected item does not
+        # have to instantiate its transform handler just to be measured.
+        scale = self._view_scale()
+        hs = TransformHandler.BASE_HANDLE_SIZE / scale
+        sp = TransformHandler.BASE_HANDLE_SPACE / scale
+        rot = TransformHandler.BASE_ROTATION_OFFSET / scale
         margin = hs + sp
         top_margin = rot + hs
         return rect.adjusted(-margin, -top_margin, margin, margin)
@@ -67,7 +98,10 @@ class BaseDrawingItem(QGraphicsItem):
         # Only draw transform handles when selected and not during a move
         if self.isSelected():
             self.transform_handler.paint(painter, option, widget)
-        elif self._is_hovering:
+        elif self._is_hovering and option.levelOfDetailFromTransform(
+            painter.worldTransform()
+        ) >= 0.5:
+            # Hover outlines are invisible noise at low zoom; skip them.
             self._paint_hover(painter)
 
     def _paint_content(
@@ -82,9 +116,7 @@ class BaseDrawingItem(QGraphicsItem):
     def _paint_hover(self, painter: QPainter) -> None:
         """Draw a dashed rectangle on hover when not selected."""
         rect = self.contentRect()
-        pen = QPen(QColor("#888888"), 1, Qt.PenStyle.DashLine)
-        pen.setCosmetic(True)
-        painter.setPen(pen)
+        painter.setPen(self._HOVER_PEN)
         painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.drawRect(rect)
 
@@ -106,7 +138,7 @@ class BaseDrawingItem(QGraphicsItem):
         # When starting a move via mouse press, mark `_is_moving`
         if event.button() == Qt.MouseButton.LeftButton:
             self._is_moving = True
-            self.setCursor(Qt.CursorShape.ClosedHandCursor)
+            self._set_cursor(Qt.CursorShape.ClosedHandCursor)
 
         super().mousePressEvent(event)
 
@@ -133,16 +165,17 @@ class BaseDrawingItem(QGraphicsItem):
             self._is_transforming = False
             self._active_handle = None
             self.transform_handler.end_transform()
-            self.setCursor(Qt.CursorShape.ArrowCursor)
+            self._set_cursor(Qt.CursorShape.ArrowCursor)
             event.accept()
             return
 
         if self._is_moving:
             self._is_moving = False
             # Recalculate handles and repaint
-            self.transform_handler.invalidate_cache()
+            if self._transform_handler is not None:
+                self._transform_handler.invalidate_cache()
             self.update()
-            self.setCursor(Qt.CursorShape.ArrowCursor)
+            self._set_cursor(Qt.CursorShape.ArrowCursor)
 
         super().mouseReleaseEvent(event)
 
@@ -158,15 +191,15 @@ class BaseDrawingItem(QGraphicsItem):
             handle = self.transform_handler.handle_at(event.pos())
             if handle is not None:
                 cursor = self.transform_handler.cursor_for_handle(handle)
-                self.setCursor(cursor)
+                self._set_cursor(cursor)
             else:
-                self.setCursor(Qt.CursorShape.ArrowCursor)
+                self._set_cursor(Qt.CursorShape.ArrowCursor)
         super().hoverMoveEvent(event)
 
     def hoverLeaveEvent(self, event: QGraphicsSceneHoverEvent) -> None:
         """Reset hover state and cursor."""
         self._is_hovering = False
-        self.setCursor(Qt.CursorShape.ArrowCursor)
+        self._set_cursor(Qt.CursorShape.ArrowCursor)
         self.update()
         super().hoverLeaveEvent(event)
 
@@ -176,16 +209,24 @@ class BaseDrawingItem(QGraphicsItem):
             change
             == QGraphicsItem.GraphicsItemChange.ItemPositionHasChanged
         ):
-            # Skip drawing handles while moving; cache invalidated on release
-            self.transform_handler.invalidate_cache()
+            # Programmatic setPos (snapping, clamping) can report the same
+            # position; only invalidate when the item actually moved.
+            if value != self._last_pos:
+                self._last_pos = QPointF(value)
+                # Skip drawing handles while moving; cache invalidated on release
+                if self._transform_handler is not None:
+                    self._transform_handler.invalidate_cache()
         elif (
             change
             == QGraphicsItem.GraphicsItemChange.ItemSelectedChange
         ):
-            # Selection toggled; refresh handles and repaint immediately
-            self.prepareGeometryChange()
-            self.transform_handler.invalidate_cache()
-            self.update()
+            # Selection toggled; refresh handles and repaint immediately,
+            # but only when the selected state really flips.
+            if bool(value) != self.isSelected():
+                self.prepareGeometryChange()
+                if self._transform_handler is not None:
+                    self._transform_handler.invalidate_cache()
+                self.update()
         return super().itemChange(change, value)
 
     def update_properties(self, props):
@@ -193,5 +234,6 @@ class BaseDrawingItem(QGraphicsItem):
         self.prepareGeometryChange()
         for k, v in props.items():
             self.properties[k] = v
-        self.transform_handler.invalidate_cache()
+        if self._transform_handler is not None:
+            self._transform_handler.invalidate_cache()
         self.update()
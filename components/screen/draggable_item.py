@@ -17,10 +17,16 @@ from PyQt6.QtWidgets import (
 class DraggableGraphicsItem(QGraphicsItem):
     """Base class for draggable graphics items."""
 
+    # Shared hover decoration, built once instead of per paint call.
+    _HOVER_PEN = QPen(QColor("#888888"), 1, Qt.PenStyle.DashLine)
+
     def __init__(self, element_data, parent=None):
         super().__init__(parent)
         self.element_data = element_data
         self._is_hovering = False
+        # boundingRect() is hammered by hit testing and the scene index;
+        # cache the rect and rebuild only when the size actually changes.
+        self._cached_bounding_rect: Optional[QRectF] = None
 
         # Enable selection, movement, focus and geometry change notifications
         self.setFlags(
@@ -31,16 +37,27 @@ class DraggableGraphicsItem(QGraphicsItem):
         )
 
         self.setAcceptHoverEvents(True)
+        self._current_cursor_shape = Qt.CursorShape.PointingHandCursor
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
+    def _set_cursor(self, shape: Qt.CursorShape) -> None:
+        """Set the cursor only when the shape actually changes."""
+        if shape != self._current_cursor_shape:
+            self._current_cursor_shape = shape
+            self.setCursor(shape)
+
     def boundingRect(self) -> QRectF:
         """Return the bounding rectangle for painting and selection."""
-        return QRectF(
-            0,
-            0,
-            self.element_data.size["width"],
-            self.element_data.size["height"],
-        )
+        rect = self._cached_bounding_rect
+        if rect is None:
+            rect = QRectF(0, 0, self.element_data.w, self.element_data.h)
+            self._cached_bounding_rect = rect
+        return rect
+
+    def invalidate_bounding_rect(self) -> None:
+        """Drop the cached bounding rect after the element size changed."""
+        self.prepareGeometryChange()
+        self._cached_bounding_rect = None
 
     def paint(
         self,
@@ -55,8 +72,13 @@ class DraggableGraphicsItem(QGraphicsItem):
         if self.isSelected():
             self._paint_selection(painter)
 
-        # Draw hover outline when not selected
-        if self._is_hovering and not self.isSelected():
+        # Draw hover outline when not selected; skip it at low zoom where
+        # the dashed line would be invisible anyway.
+        if (
+            self._is_hovering
+            and not self.isSelected()
+            and option.levelOfDetailFromTransform(painter.worldTransform()) >= 0.5
+        ):
             self._paint_hover(painter)
 
     def _paint_content(
@@ -75,7 +97,7 @@ class DraggableGraphicsItem(QGraphicsItem):
     def _paint_hover(self, painter: QPainter):
         """Draw a dashed rectangle on hover when unselected."""
         rect = self.boundingRect()
-        painter.setPen(QPen(QColor("#888888"), 1, Qt.PenStyle.DashLine))
+        painter.setPen(self._HOVER_PEN)
         painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.drawRect(rect)
 
@@ -107,13 +129,13 @@ class DraggableGraphicsItem(QGraphicsItem):
     def mousePressEvent(self, event: QGraphicsSceneMouseEvent) -> None:
         """Change cursor on press and forward to base implementation."""
         if event.button() == Qt.MouseButton.LeftButton:
-            self.setCursor(Qt.CursorShape.ClosedHandCursor)
+            self._set_cursor(Qt.CursorShape.ClosedHandCursor)
         super().mousePressEvent(event)
 
     def mouseReleaseEvent(self, event: QGraphicsSceneMouseEvent) -> None:
         """Restore cursor on release and forward to base implementation."""
         if event.button() == Qt.MouseButton.LeftButton:
-            self.setCursor(Qt.CursorShape.PointingHandCursor)
+            self._set_cursor(Qt.CursorShape.PointingHandCursor)
         super().mouseReleaseEvent(event)
 
     def mouseDoubleClickEvent(
@@ -6,9 +6,11 @@ This widget provides functionality for creating, editing, and organizing screens
 
 from __future__ import annotations
 
-from typing import Optional, Dict, Any
+import copy
+from typing import Optional, Dict, Any, Final
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 from PyQt6.QtWidgets import (
     QWidget,
@@ -18,13 +20,18 @@ from PyQt6.QtWidgets import (
     QMenu,
     QMessageBox,
 )
-from PyQt6.QtCore import pyqtSignal, Qt, QRect
-from PyQt6.QtGui import QAction, QPainter, QMouseEvent
+from PyQt6.QtCore import pyqtSignal, Qt, QRect, QTimer
+from PyQt6.QtGui import QAction, QPainter, QMouseEvent, QBrush
 
 from services.screen_data_service import screen_service
 from services.command_history_service import command_history_service
-from services.commands import AddScreenCommand, RemoveScreenCommand
+from services.commands import (
+    AddScreenCommand,
+    RemoveScreenCommand,
+    UpdateScreenPropertiesCommand,
+)
 from dialogs.screen_properties_dialog import ScreenPropertiesDialog
+from dialogs.screen_design_dialog import ScreenDesignDialog
 from utils.icon_manager import IconManager
 
 
@@ -35,6 +42,43 @@ class ScreenType(Enum):
     REPORT = "report"
 
 
+# Frequently used Qt enum values bound once; saves the enum attribute
+# chain on every per-item setData/data call in the populate loop.
+_USER_ROLE = Qt.ItemDataRole.UserRole
+_USER_ROLE_1 = Qt.ItemDataRole.UserRole + 1
+# Remembers the icon name an item was last painted with, so refreshes can
+# skip redundant setIcon calls.
+_ICON_NAME_ROLE = Qt.ItemDataRole.UserRole + 3
+
+# Direct value-to-member map; avoids Enum.__call__'s lookup machinery and
+# the ValueError path for unknown legacy type strings.
+_TYPE_MAP: Final[Dict[str, ScreenType]] = {t.value: t for t in ScreenType}
+
+# Display names and icon names per screen type, shared by category and
+# screen nodes; built once instead of per item creation.
+_CATEGORY_NAMES: Final[Dict[ScreenType, str]] = {
+    ScreenType.BASE: "Base Screens",
+    ScreenType.WINDOW: "Window Screens",
+    ScreenType.REPORT: "Report Screens",
+}
+_CATEGORY_ICON_NAMES: Final[Dict[ScreenType, str]] = {
+    ScreenType.BASE: "fa5s.window-maximize",
+    ScreenType.WINDOW: "fa5s.window-restore",
+    ScreenType.REPORT: "fa5s.file-alt",
+}
+_SCREEN_ICON_NAMES: Final[Dict[ScreenType, str]] = {
+    ScreenType.BASE: "fa5s.window-maximize",
+    ScreenType.WINDOW: "fa5s.window-restore",
+    ScreenType.REPORT: "fa5s.file-alt",
+}
+
+
+@lru_cache(maxsize=64)
+def _cached_icon(icon_name: str, color: str, size: Optional[int] = None):
+    """Build a QIcon once per (name, color, size) and reuse it thereafter."""
+    return IconManager.create_icon(icon_name, color=color, size=size)
+
+
 @dataclass
 class ScreenItemData:
     """Data structure for screen items to improve type safety."""
@@ -48,6 +92,28 @@ class ScreenItemData:
 class ScreenTreeWidget(QTreeWidget):
     """Custom tree widget with expand/collapse icons for screen management."""
 
+    # Branch indicator pixmaps shared by all instances; rasterized once at
+    # the right device-pixel ratio so painting is a plain blit per row.
+    _PLUS_PIXMAP = None
+    _MINUS_PIXMAP = None
+
+    def _branch_pixmap(self, is_expanded: bool):
+        """Return the cached plus/minus indicator pixmap."""
+        cls = type(self)
+        if cls._PLUS_PIXMAP is None:
+            size = self._icon_size
+            dpr = self.devicePixelRatioF()
+            for attr, name in (
+                ("_PLUS_PIXMAP", "fa5s.plus-square"),
+                ("_MINUS_PIXMAP", "fa5s.minus-square"),
+            ):
+                pixmap = IconManager.create_icon(name).pixmap(
+                    int(size * dpr), int(size * dpr)
+                )
+                pixmap.setDevicePixelRatio(dpr)
+                setattr(cls, attr, pixmap)
+        return cls._MINUS_PIXMAP if is_expanded else cls._PLUS_PIXMAP
+
     def __init__(self, parent=None):
         super().__init__(parent)
         # Disable the default double-click expand/collapse behavior
@@ -55,32 +121,42 @@ class ScreenTreeWidget(QTreeWidget):
         # Use a fixed indentation for consistent alignment
         self.setIndentation(20)
         self.setRootIsDecorated(True)
+        # All rows are the same height; lets the view compute layout and
+        # scrollbars in O(1) instead of measuring every item.
+        self.setUniformRowHeights(True)
+        # Indicator geometry is fixed; precompute it instead of rederiving
+        # it on every paint and mouse press.
+        self._indent = self.indentation()
+        self._icon_size = 16
+        self._icon_offset = (self._indent - self._icon_size) // 2
 
     def mousePressEvent(self, event: QMouseEvent):
         """Override mouse press to toggle branch expansion on single click."""
-        from PyQt6.QtCore import QModelIndex
-
         index = self.indexAt(event.pos())
         if not index.isValid():
             super().mousePressEvent(event)
             return
 
+        # Leaf rows never show an indicator; skip the hit-test geometry
+        item = self.itemFromIndex(index)
+        if item is not None and item.childCount() == 0 and (
+            item.childIndicatorPolicy()
+            != QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator
+        ):
+            super().mousePressEvent(event)
+            return
+
         # Determine if the click is on the branch indicator
         branch_rect = self.visualRect(index)
-        indent = self.indentation()
-        icon_size = 16
+        icon_size = self._icon_size
 
-        # Compute the level depth to align the indicator correctly
-        level = 0
-        parent_index = index.parent()
-        while parent_index.isValid():
-            level += 1
-            parent_index = parent_index.parent()
+        # The tree is two levels deep, so the depth is just "has a parent"
+        level = 1 if index.parent().isValid() else 0
 
         indicator_x = (
             branch_rect.left()
-            + (level * indent)
-            + (indent - icon_size) // 2
+            + (level * self._indent)
+            + self._icon_offset
         )
         indicator_y = branch_rect.top() + (
             branch_rect.height() - icon_size
@@ -93,17 +169,10 @@ class ScreenTreeWidget(QTreeWidget):
         )
 
         # Toggle expand/collapse if the click falls within the indicator
-        if indicator_rect.contains(event.pos()):
-            item = self.itemFromIndex(index)
-            if item:
-                has_children = item.childCount() > 0
-                show_indicator_policy = (
-                    item.childIndicatorPolicy()
-                    == QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator
-                )
-                if has_children or show_indicator_policy:
-                    self.setExpanded(index, not self.isExpanded(index))
-                    return
+        # (the early leaf return guarantees this item can expand)
+        if indicator_rect.contains(event.pos()) and item is not None:
+            self.setExpanded(index, not self.isExpanded(index))
+            return
 
         # Otherwise, use default behavior
         super().mousePressEvent(event)
@@ -113,36 +182,30 @@ class ScreenTreeWidget(QTreeWidget):
         # Draw default branch lines and indicator first
         super().drawBranches(painter, rect, index)
 
-        # Only draw icons if item has children
+        # Only draw icons for items with children, materialized or pending
         item = self.itemFromIndex(index)
-        if not item or item.childCount() == 0:
+        if not item or (
+            item.childCount() == 0
+            and item.childIndicatorPolicy()
+            != QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator
+        ):
             return
 
-        # Choose plus or minus icon based on expansion state
+        # Choose plus or minus pixmap based on expansion state
         is_expanded = self.isExpanded(index)
-        icon_name = (
-            "fa5s.minus-square" if is_expanded else "fa5s.plus-square"
-        )
-        icon = IconManager.create_icon(icon_name)
-        icon_size = 16
-
-        # Compute icon position relative to tree level
-        level = 0
-        parent_index = index.parent()
-        while parent_index.isValid():
-            level += 1
-            parent_index = parent_index.parent()
-
-        indent = self.indentation()
-        icon_x = rect.left() + (level * indent) + (
-            indent - icon_size
-        ) // 2
+        pixmap = self._branch_pixmap(is_expanded)
+        icon_size = self._icon_size
+
+        # The tree is two levels deep, so the depth is just "has a parent"
+        level = 1 if index.parent().isValid() else 0
+
+        icon_x = rect.left() + (level * self._indent) + self._icon_offset
         icon_y = rect.top() + (
             rect.height() - icon_size
         ) // 2
 
-        # Paint the icon
-        icon.paint(painter, icon_x, icon_y, icon_size, icon_size)
+        # Blit the pre-rasterized pixmap
+        painter.drawPixmap(icon_x, icon_y, pixmap)
 
 
 class ScreenManagerWidget(QWidget):
@@ -153,11 +216,24 @@ class ScreenManagerWidget(QWidget):
     screen_open_requested = pyqtSignal(str)  # emitted with screen_id
     selection_changed = pyqtSignal()
 
+    # Brushes for the active-screen highlight, shared by all instances.
+    _HIGHLIGHT_BRUSH = QBrush(Qt.GlobalColor.darkGray)
+    _CLEAR_BRUSH = QBrush(Qt.GlobalColor.transparent)
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         """Initialize the ScreenManagerWidget."""
         super().__init__(parent)
         self._screen_items: Dict[str, QTreeWidgetItem] = {}
         self._category_items: Dict[ScreenType, QTreeWidgetItem] = {}
+        # Collapses bursts of screen_list_changed signals into one refresh
+        self._refresh_pending = False
+        self._highlighted_id: Optional[str] = None
+        self._active_item: Optional[QTreeWidgetItem] = None
+        # Screens whose tree items are deferred until their category is
+        # first expanded, keyed by screen type then screen id.
+        self._pending_screens: Dict[ScreenType, Dict[str, Dict[str, Any]]] = {
+            t: {} for t in ScreenType
+        }
 
         self._setup_ui()
         self._connect_signals()
@@ -174,20 +250,36 @@ class ScreenManagerWidget(QWidget):
         self, screen_id: Optional[str]
     ) -> None:
         """Highlight the active screen in the tree view."""
-        # Clear all highlights
-        for item in self._screen_items.values():
-            for col in range(item.columnCount()):
-                item.setBackground(
-                    col, Qt.GlobalColor.transparent
-                )
+        if screen_id == self._highlighted_id:
+            return
+        item = self._screen_items.get(screen_id) if screen_id else None
+        self._apply_active_highlight(item, screen_id)
 
-        # Highlight the selected item
-        if screen_id and screen_id in self._screen_items:
-            item = self._screen_items[screen_id]
-            for col in range(item.columnCount()):
-                item.setBackground(
-                    col, Qt.GlobalColor.darkGray
-                )
+    def update_active_screen_highlight_item(
+        self, item: Optional[QTreeWidgetItem]
+    ) -> None:
+        """Highlight the given tree item directly, skipping the id lookup."""
+        if item is self._active_item:
+            return
+        screen_id = item.data(0, _USER_ROLE) if item is not None else None
+        self._apply_active_highlight(item, screen_id)
+
+    def _apply_active_highlight(
+        self, item: Optional[QTreeWidgetItem], screen_id: Optional[str]
+    ) -> None:
+        """Move the highlight from the previous active row to ``item``."""
+        # The tree has a single column, so clear only the previously
+        # highlighted row and paint only the new one.
+        if self._active_item is not None:
+            self._active_item.setBackground(0, self._CLEAR_BRUSH)
+
+        if item is not None:
+            item.setBackground(0, self._HIGHLIGHT_BRUSH)
+            self._active_item = item
+            self._highlighted_id = screen_id
+        else:
+            self._active_item = None
+            self._highlighted_id = None
 
     def _setup_ui(self) -> None:
         """Build the tree widget layout and configure signals."""
@@ -220,21 +312,28 @@ class ScreenManagerWidget(QWidget):
     def _connect_signals(self) -> None:
         """Connect to screen-service signals."""
         screen_service.screen_list_changed.connect(
-            self._populate_screen_list
+            self._schedule_populate
         )
 
-    def _populate_screen_list(self) -> None:
-        """Populate the tree with category nodes and screen nodes."""
-        self.screen_tree.clear()
-        self._screen_items.clear()
-        self._category_items.clear()
+    def _schedule_populate(self) -> None:
+        """Coalesce rapid list-changed signals into one refresh per turn."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(0, self._do_populate)
 
-        # Top-level design node
-        design_item = QTreeWidgetItem(self.screen_tree)
+    def _do_populate(self) -> None:
+        """Run the deferred tree refresh."""
+        self._refresh_pending = False
+        self._populate_screen_list()
+
+    def _build_static_items(self) -> None:
+        """Create the design node and category nodes exactly once."""
+        design_item = QTreeWidgetItem()
         design_item.setText(0, "Screen Design")
         design_item.setIcon(
             0,
-            IconManager.create_icon(
+            _cached_icon(
                 "fa5s.palette",
                 color="#ff9800",
                 size=16,
@@ -242,62 +341,165 @@ class ScreenManagerWidget(QWidget):
         )
         design_item.setData(
             0,
-            Qt.ItemDataRole.UserRole,
+            _USER_ROLE,
             "screen_design_property",
         )
 
-        # Create category nodes
         for screen_type in ScreenType:
             category_item = self._create_category_item(screen_type)
+            # Show an expand indicator even while children are deferred
+            category_item.setChildIndicatorPolicy(
+                QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator
+            )
             self._category_items[screen_type] = category_item
 
-        # Add screens to categories
+        # One bulk insert instead of a model-signal pair per top-level item
+        self.screen_tree.addTopLevelItems(
+            [design_item, *self._category_items.values()]
+        )
+
+        self.screen_tree.itemExpanded.connect(self._on_category_expanded)
+
+    def _populate_screen_list(self) -> None:
+        """Sync the tree with the screen service, touching only the delta."""
+        tree = self.screen_tree
+        # Batch the whole mutation: no intermediate repaints, no
+        # itemSelectionChanged storms while items come and go.
+        tree.setUpdatesEnabled(False)
+        tree.blockSignals(True)
+        try:
+            self._sync_screen_list()
+        finally:
+            tree.blockSignals(False)
+            tree.setUpdatesEnabled(True)
+            viewport = tree.viewport()
+            if viewport is not None:
+                viewport.update()
+
+    def _sync_screen_list(self) -> None:
+        """Apply the service's screen list to the tree."""
+        if not self._category_items:
+            self._build_static_items()
+
         screens = screen_service.get_all_screens()
-        for screen_id, screen_data in screens.items():
-            screen_type = ScreenType(
-                screen_data.get("type", "base")
-            )
-            screen_item = self._create_screen_item(
-                screen_id, screen_data
+        old_ids = set(self._screen_items)
+        pending_ids = {
+            screen_id
+            for per_type in self._pending_screens.values()
+            for screen_id in per_type
+        }
+        new_ids = set(screens)
+
+        # Remove screens that no longer exist
+        for screen_id in old_ids - new_ids:
+            item = self._screen_items.pop(screen_id)
+            if item is self._active_item:
+                self._active_item = None
+                self._highlighted_id = None
+            parent = item.parent()
+            if parent is not None:
+                parent.removeChild(item)
+        for per_type in self._pending_screens.values():
+            for screen_id in pending_ids - new_ids:
+                per_type.pop(screen_id, None)
+
+        # Add screens that appeared; defer item creation for screens under
+        # categories the user has not expanded yet. New items are collected
+        # per category and inserted with one bulk addChildren call.
+        new_children: Dict[ScreenType, list] = {}
+        for screen_id in new_ids - old_ids:
+            screen_data = screens[screen_id]
+            screen_type = _TYPE_MAP.get(
+                screen_data.get("type", "base"), ScreenType.BASE
             )
-            if screen_type in self._category_items:
-                self._category_items[screen_type].addChild(
-                    screen_item
+            category_item = self._category_items.get(screen_type)
+            if category_item is None:
+                continue
+            if category_item.isExpanded():
+                self._pending_screens[screen_type].pop(screen_id, None)
+                screen_item = self._create_screen_item(
+                    screen_id, screen_data
                 )
+                new_children.setdefault(screen_type, []).append(screen_item)
                 self._screen_items[screen_id] = screen_item
+            else:
+                self._pending_screens[screen_type][screen_id] = screen_data
+        for screen_type, items in new_children.items():
+            self._category_items[screen_type].addChildren(items)
+
+        # Update surviving screens in place, only where values differ
+        for screen_id in old_ids & new_ids:
+            screen_data = screens[screen_id]
+            item = self._screen_items[screen_id]
+
+            number = str(screen_data.get("number", screen_id))
+            name = screen_data.get("name", f"Screen {screen_id}")
+            new_label = f"[{number}] - {name}"
+            if item.text(0) != new_label:
+                item.setText(0, new_label)
+            if item.data(0, _USER_ROLE_1) != screen_data.get("number"):
+                item.setData(
+                    0,
+                    _USER_ROLE_1,
+                    screen_data.get("number"),
+                )
 
-        # Expand categories by default
-        for category_item in self._category_items.values():
-            category_item.setExpanded(True)
+            # Move the item if its screen type changed category
+            screen_type = _TYPE_MAP.get(
+                screen_data.get("type", "base"), ScreenType.BASE
+            )
+            target = self._category_items.get(screen_type)
+            if target is not None and item.parent() is not target:
+                parent = item.parent()
+                if parent is not None:
+                    parent.removeChild(item)
+                target.addChild(item)
+
+            # Refresh the icon only when the effective icon name changed
+            icon_name = _SCREEN_ICON_NAMES.get(
+                screen_type, "fa5s.window-maximize"
+            )
+            if item.data(0, _ICON_NAME_ROLE) != icon_name:
+                item.setIcon(
+                    0, _cached_icon(icon_name, color="#c8cdd4", size=16)
+                )
+                item.setData(0, _ICON_NAME_ROLE, icon_name)
 
         self.screen_tree.resizeColumnToContents(0)
 
+    def _on_category_expanded(self, item: QTreeWidgetItem) -> None:
+        """Materialize deferred screen items when a category is expanded."""
+        for screen_type, category_item in self._category_items.items():
+            if category_item is not item:
+                continue
+            pending = self._pending_screens[screen_type]
+            if pending:
+                new_items = []
+                for screen_id, screen_data in pending.items():
+                    screen_item = self._create_screen_item(
+                        screen_id, screen_data
+                    )
+                    new_items.append(screen_item)
+                    self._screen_items[screen_id] = screen_item
+                category_item.addChildren(new_items)
+                pending.clear()
+            return
+
     def _create_category_item(
         self, screen_type: ScreenType
     ) -> QTreeWidgetItem:
         """Create and return a category node for a given screen type."""
-        category_names = {
-            ScreenType.BASE: "Base Screens",
-            ScreenType.WINDOW: "Window Screens",
-            ScreenType.REPORT: "Report Screens",
-        }
-        icons = {
-            ScreenType.BASE: "fa5s.window-maximize",
-            ScreenType.WINDOW: "fa5s.window-restore",
-            ScreenType.REPORT: "fa5s.file-alt",
-        }
-
-        item = QTreeWidgetItem(self.screen_tree)
-        item.setText(0, category_names[screen_type])
+        item = QTreeWidgetItem()
+        item.setText(0, _CATEGORY_NAMES[screen_type])
         item.setIcon(
             0,
-            IconManager.create_icon(
-                icons[screen_type], color="#5dadec"
+            _cached_icon(
+                _CATEGORY_ICON_NAMES[screen_type], color="#5dadec"
             ),
         )
         item.setData(
             0,
-            Qt.ItemDataRole.UserRole,
+            _USER_ROLE,
             f"category_{screen_type.value}",
         )
         return item
@@ -312,34 +514,28 @@ class ScreenManagerWidget(QWidget):
         name = screen_data.get(
             "name", f"Screen {screen_id}"
         )
-        screen_type = ScreenType(
-            screen_data.get("type", "base")
+        screen_type = _TYPE_MAP.get(
+            screen_data.get("type", "base"), ScreenType.BASE
         )
 
-        # Map screen type to icon
-        screen_type_icons = {
-            ScreenType.BASE: "fa5s.window-maximize",
-            ScreenType.WINDOW: "fa5s.window-restore",
-            ScreenType.REPORT: "fa5s.file-alt",
-        }
-
-        icon_name = screen_type_icons.get(
+        icon_name = _SCREEN_ICON_NAMES.get(
             screen_type, "fa5s.window-maximize"
         )
-        screen_icon = IconManager.create_icon(
+        screen_icon = _cached_icon(
             icon_name, color="#c8cdd4", size=16
         )
 
         screen_item.setIcon(0, screen_icon)
+        screen_item.setData(0, _ICON_NAME_ROLE, icon_name)
         screen_item.setText(0, f"[{number}] - {name}")
         screen_item.setData(
             0,
-            Qt.ItemDataRole.UserRole,
+            _USER_ROLE,
             screen_id,
         )
         screen_item.setData(
             0,
-            Qt.ItemDataRole.UserRole + 1,
+            _USER_ROLE_1,
             screen_data.get("number"),
         )
 
@@ -355,8 +551,6 @@ class ScreenManagerWidget(QWidget):
 
         if item_data == "screen_design_property":
             # Launch the generic screen-design dialog
-            from dialogs.screen_design_dialog import ScreenDesignDialog
-
             dialog = ScreenDesignDialog(
                 parent=self,
                 screen_id=None,
@@ -498,10 +692,6 @@ class ScreenManagerWidget(QWidget):
             new_data["type"] = screen_data.get(
                 "type", "base"
             )
-            from services.commands import (
-                UpdateScreenPropertiesCommand,
-            )
-
             command = UpdateScreenPropertiesCommand(
                 screen_id,
                 new_data,
@@ -539,10 +729,6 @@ class ScreenManagerWidget(QWidget):
         self, screen_id: str
     ) -> None:
         """Open the screen-design dialog for a specific screen."""
-        from dialogs.screen_design_dialog import (
-            ScreenDesignDialog,
-        )
-
         screen_data = screen_service.get_screen(
             screen_id
         )
@@ -568,20 +754,17 @@ class ScreenManagerWidget(QWidget):
         self, screen_id: str, design_data: dict
     ) -> None:
         """Save the updated screen design via command history."""
-        screen_data = screen_service.get_screen(
-            screen_id
-        )
-        if not screen_data:
+        old_screen_data = screen_service.get_screen(screen_id)
+        if not old_screen_data:
             return
-        screen_data["design"] = design_data
-        from services.commands import (
-            UpdateScreenPropertiesCommand,
-        )
-
+        # The service hands back its live dict; copy before mutating so the
+        # command's "old" and "new" states don't alias the same object.
+        new_screen_data = copy.deepcopy(old_screen_data)
+        new_screen_data["design"] = design_data
         command = UpdateScreenPropertiesCommand(
             screen_id,
-            screen_data,
-            screen_service.get_screen(screen_id),
+            new_screen_data,
+            old_screen_data,
         )
         command_history_service.add_command(
             command
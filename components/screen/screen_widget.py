@@ -1,6 +1,8 @@
 #component/screen/screen_widget
 from __future__ import annotations
 
+import copy
+import functools
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
@@ -10,9 +12,10 @@ from PyQt6.QtWidgets import (
     QGraphicsRectItem, QGraphicsTextItem, QFrame, QGraphicsItem,
     QGraphicsSceneMouseEvent
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QRectF, QPointF, QObject
+from PyQt6.QtCore import Qt, pyqtSignal, QRectF, QPointF, QObject, QTimer
 from PyQt6.QtGui import (
-    QPainter, QPen, QColor, QBrush, QFont, QMouseEvent, QWheelEvent, QKeyEvent
+    QPainter, QPen, QColor, QBrush, QFont, QMouseEvent, QWheelEvent, QKeyEvent,
+    QPixmap, QPixmapCache
 )
 
 from services.screen_data_service import screen_service
@@ -21,25 +24,64 @@ from services.commands import MoveChildCommand
 from services.command_history_service import command_history_service
 from utils import constants
 
-from tools.drawing_tools.rectangle_tool import RectangleTool
-from tools.drawing_tools.circle_tool import CircleTool
-from tools.drawing_tools.polygon_tool import PolygonTool
-from tools.drawing_tools.text_tool import TextTool
+@functools.lru_cache(maxsize=256)
+def _qcolor_from_hex(color: str) -> QColor:
+    """Return an interned QColor for a hex string.
 
+    Callers must treat the result as read-only; copy with ``QColor(c)``
+    before mutating.
+    """
+    return QColor(color)
+
+
+# Drawing tool modules are imported lazily inside the element-type branch
+# that needs them, keeping screen open time free of unused tool imports.
+
+# Resolved on first double-click and cached so later clicks skip the
+# import machinery.
+_ButtonPropertiesDialog = None
+
+
+def _button_properties_dialog_cls():
+    """Import and cache the ButtonPropertiesDialog class."""
+    global _ButtonPropertiesDialog
+    if _ButtonPropertiesDialog is None:
+        from components.button.button_properties_dialog import ButtonPropertiesDialog
+        _ButtonPropertiesDialog = ButtonPropertiesDialog
+    return _ButtonPropertiesDialog
 
-@dataclass
+
+@dataclass(slots=True)
 class ElementData:
-    """Data structure for screen elements."""
+    """Data structure for screen elements.
+
+    Position and size are stored as flat scalars so the paint path reads
+    plain attributes instead of chasing two dict lookups per access.
+    """
     element_id: str
     element_type: str
-    position: Dict[str, int]
-    size: Dict[str, int]
+    x: int
+    y: int
+    w: int
+    h: int
     properties: Dict[str, Any]
 
+    @property
+    def position(self) -> Dict[str, int]:
+        """Dict view of the position, for callers expecting the old shape."""
+        return {'x': self.x, 'y': self.y}
+
+    @property
+    def size(self) -> Dict[str, int]:
+        """Dict view of the size, for callers expecting the old shape."""
+        return {'width': self.w, 'height': self.h}
+
 
 class ScreenElement(ABC):
     """Abstract base class for screen elements."""
-    
+
+    __slots__ = ('data',)
+
     def __init__(self, data: ElementData):
         self.data = data
     
@@ -55,6 +97,7 @@ class ScreenElement(ABC):
 
 
 LOD_THRESHOLD = 0.5  # Zoom level to switch between simple and detailed rendering
+LOD_PLACEHOLDER = 0.2  # Below this zoom, draw a flat color block only
 
 
 from components.screen.base_drawing_item import BaseDrawingItem
@@ -62,61 +105,123 @@ from components.screen.base_drawing_item import BaseDrawingItem
 class ButtonGraphicsItem(BaseDrawingItem):
     """A custom graphics item for a button with Level of Detail (LOD) support and transform capabilities."""
 
+    # Current LOD tier (0 = flat fill, 1 = rect only, 2 = rect + text).
+    # The canvas broadcasts tier changes on zoom so paint never has to
+    # query the painter's world transform per item.
+    _lod_tier = 2
+
+    def set_lod_tier(self, tier: int) -> None:
+        """Adopt the tier the canvas computed for the current zoom."""
+        if tier != self._lod_tier:
+            self._lod_tier = tier
+            self.update()
+
     def __init__(self, data: ElementData):
         super().__init__()
         self.element_data = data
-        self.setPos(self.element_data.position['x'], self.element_data.position['y'])
-        
+        self.setPos(self.element_data.x, self.element_data.y)
+
+        # Content rect reused across paints; resized in place when the
+        # button's width/height change.
+        self._content_rect = QRectF(0, 0, data.w, data.h)
+
+        # Blit a per-item device-space pixmap on repaints triggered by
+        # neighbouring scene updates; Qt invalidates it on update() and
+        # re-rasterizes when the zoom level changes.
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
         # Set properties for transform handler
         self.properties = {
-            'width': self.element_data.size['width'],
-            'height': self.element_data.size['height'],
+            'width': self.element_data.w,
+            'height': self.element_data.h,
             **self.element_data.properties
         }
 
-    def contentRect(self) -> QRectF:
-        """Return the rectangle occupied by the button content."""
-        return QRectF(
-            0,
-            0,
-            self.element_data.size['width'],
-            self.element_data.size['height'],
+        # Pixmap-cache key prefix; rebuilt only when the rendered look
+        # (size, colors or label) actually changes.
+        self._cache_key_base = self._build_cache_key_base()
+        # Paint objects built once instead of per rasterization; going
+        # through the binding for fresh QColor/QBrush/QPen/QFont instances
+        # every paint is measurable with many buttons on screen.
+        self._no_pen = QPen(Qt.PenStyle.NoPen)
+        self._font = QFont("Arial", 10)
+        self._refresh_paint_objects()
+
+    def _refresh_paint_objects(self) -> None:
+        """Rebuild the cached colors, brush, pen and label string."""
+        props = self.element_data.properties
+        self._bg_qcolor = _qcolor_from_hex(props.get('background_color', '#5a6270'))
+        self._bg_brush = QBrush(self._bg_qcolor)
+        self._text_pen = QPen(_qcolor_from_hex(props.get('text_color', '#ffffff')))
+        self._label_str = props.get('label', 'Button')
+
+    def _build_cache_key_base(self) -> str:
+        """Build the QPixmapCache key prefix from the button's look."""
+        props = self.element_data.properties
+        data = self.element_data
+        return (
+            f"btn|{data.w}x{data.h}"
+            f"|{props.get('background_color', '#5a6270')}"
+            f"|{props.get('text_color', '#ffffff')}"
+            f"|{props.get('label', 'Button')}"
         )
 
-    def _paint_content(self, painter: QPainter, option, widget=None) -> None:
-        """Paint the button with LOD."""
-        lod = painter.worldTransform().m11()
-
-        bg_color = QColor(self.element_data.properties.get('background_color', '#5a6270'))
-        painter.setBrush(QBrush(bg_color))
-        painter.setPen(QPen(Qt.PenStyle.NoPen))
-        painter.drawRect(self.contentRect())
-
-        if lod > LOD_THRESHOLD:
-            text_color = QColor(self.element_data.properties.get('text_color', '#ffffff'))
-            painter.setPen(QPen(text_color))
-            
-            font = QFont("Arial", 10)
-            painter.setFont(font)
-            
-            label = self.element_data.properties.get('label', 'Button')
+    def _render_pixmap(self, tier: int) -> QPixmap:
+        """Rasterize the button once for the given LOD tier."""
+        width = max(1, int(self.element_data.w))
+        height = max(1, int(self.element_data.h))
+        pixmap = QPixmap(width, height)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setBrush(self._bg_brush)
+        painter.setPen(self._no_pen)
+        painter.drawRect(0, 0, width, height)
+
+        if tier:
+            painter.setPen(self._text_pen)
+            painter.setFont(self._font)
             painter.drawText(
-                self.contentRect(),
+                QRectF(0, 0, width, height),
                 Qt.AlignmentFlag.AlignCenter,
-                label,
+                self._label_str,
             )
+        painter.end()
+        return pixmap
+
+    def contentRect(self) -> QRectF:
+        """Return the cached rectangle occupied by the button content."""
+        return self._content_rect
+
+    def _paint_content(self, painter: QPainter, option, widget=None) -> None:
+        """Paint the button with LOD, blitting a cached pixmap when possible."""
+        tier = self._lod_tier
+
+        # Far below legible zoom the button is a few pixels; a flat fill is
+        # indistinguishable and skips the pixmap blit entirely.
+        if tier == 0:
+            painter.fillRect(self.contentRect(), self._bg_qcolor)
+            return
+
+        # Rect fill plus "Arial 10" text layout is the expensive part; cache
+        # the rasterized button and redraw it only when its look changes.
+        with_text = 1 if tier == 2 else 0
+        key = f"{self._cache_key_base}|{with_text}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = self._render_pixmap(with_text)
+            QPixmapCache.insert(key, pixmap)
+        painter.drawPixmap(0, 0, pixmap)
             
     def mouseDoubleClickEvent(self, event: QGraphicsSceneMouseEvent) -> None:
         """Handle double-click to open button properties dialog."""
-        from components.button.button_properties_dialog import ButtonPropertiesDialog
-        
         # Get the scene and view
         scene = self.scene()
         if scene and scene.views():
             view = scene.views()[0]
-            
+
             # Open the properties dialog with the view as parent
-            dialog = ButtonPropertiesDialog(self.element_data.properties, view)
+            dialog = _button_properties_dialog_cls()(self.element_data.properties, view)
             
             # Store references to button item and canvas in the dialog
             dialog.button_item = self
@@ -142,20 +247,118 @@ class ButtonGraphicsItem(BaseDrawingItem):
             self.prepareGeometryChange()
 
         if 'width' in props:
-            self.element_data.size['width'] = props['width']
+            self.element_data.w = props['width']
+            self._content_rect.setWidth(props['width'])
         if 'height' in props:
-            self.element_data.size['height'] = props['height']
+            self.element_data.h = props['height']
+            self._content_rect.setHeight(props['height'])
 
         for k, v in props.items():
             self.element_data.properties[k] = v
 
-        super().update_properties(props)         
+        # Size/colors/label may have changed; point at a fresh cache entry
+        # and rebuild the cached paint objects.
+        self._cache_key_base = self._build_cache_key_base()
+        self._refresh_paint_objects()
+
+        super().update_properties(props)
         self.update()
 
 
+class GenericElement(ScreenElement):
+    """Screen element wrapping one of the drawing-tool graphics items."""
+
+    __slots__ = ('item',)
+
+    def __init__(self, data: ElementData):
+        super().__init__(data)
+        self.item: Optional[QGraphicsItem] = None
+
+    def create_graphics_item(self) -> QGraphicsItem | None:
+        builder = _TOOL_BUILDERS.get(self.data.element_type)
+        if builder is not None:
+            self.item = builder(self.data, self.data.properties)
+
+        if self.item:
+            # Use 0 for user role, as is common practice for instance IDs
+            self.item.setData(0, self.data.element_id)
+
+        return self.item
+
+    def update_properties(self, properties: Dict[str, Any]) -> None:
+        self.data.properties.update(properties)
+        if self.item and hasattr(self.item, 'update_properties'):
+            self.item.update_properties(self.data.properties)
+
+
+# Each builder imports only its own tool module, so a screen full of
+# rectangles never loads the text tool.
+def _build_rectangle(data: ElementData, props: Dict[str, Any]) -> QGraphicsItem:
+    from tools.drawing_tools.rectangle_tool import RectangleTool
+    return RectangleTool(data.x, data.y, data.w, data.h, props.get('color', '#000000'))
+
+
+def _build_circle(data: ElementData, props: Dict[str, Any]) -> QGraphicsItem:
+    from tools.drawing_tools.circle_tool import CircleTool
+    return CircleTool(data.x, data.y, props.get('diameter', 50), props.get('color', '#000000'))
+
+
+def _build_polygon(data: ElementData, props: Dict[str, Any]) -> QGraphicsItem:
+    from tools.drawing_tools.polygon_tool import PolygonTool
+    item = PolygonTool(props.get('points', []), props.get('color', '#000000'))
+    item.setPos(data.x, data.y)
+    return item
+
+
+def _build_text(data: ElementData, props: Dict[str, Any]) -> QGraphicsItem:
+    from tools.drawing_tools.text_tool import TextTool
+    return TextTool(data.x, data.y, props.get('text', ' '), props.get('font_size', 12), props.get('color', '#000000'))
+
+
+_TOOL_BUILDERS = {
+    constants.TOOL_RECTANGLE: _build_rectangle,
+    constants.TOOL_CIRCLE: _build_circle,
+    constants.TOOL_POLYGON: _build_polygon,
+    constants.TOOL_TEXT: _build_text,
+}
+
+class BatchedElementsItem(QGraphicsItem):
+    """Single proxy item that paints every button as a flat rect.
+
+    Below ``LOD_PLACEHOLDER`` zoom, per-button paint dispatch costs more
+    than the pixels drawn. This item replaces all buttons with one
+    ``drawRects`` batch per fill color.
+    """
+
+    def __init__(self, children: List[Dict[str, Any]]):
+        super().__init__()
+        self._bounding = QRectF()
+        self._rects_by_color: Dict[str, List[QRectF]] = {}
+        for child in children:
+            if child.get('type') != 'button':
+                continue
+            pos = child.get('position', {'x': 0, 'y': 0})
+            size = child.get('size', {'width': 100, 'height': 40})
+            rect = QRectF(pos['x'], pos['y'], size['width'], size['height'])
+            color = child.get('properties', {}).get('background_color', '#5a6270')
+            self._rects_by_color.setdefault(color, []).append(rect)
+            self._bounding = self._bounding.united(rect)
+
+    def boundingRect(self) -> QRectF:
+        return self._bounding
+
+    def paint(self, painter: QPainter, option, widget=None) -> None:
+        painter.setPen(Qt.PenStyle.NoPen)
+        for color, rects in self._rects_by_color.items():
+            painter.setBrush(_qcolor_from_hex(color))
+            painter.drawRects(rects)
+
+
 class ButtonElement(ScreenElement):
     """Button element implementation."""
-    
+
+    __slots__ = ()
+
     def create_graphics_item(self) -> QGraphicsItem:
         """Create a button graphics item using the custom LOD-aware item."""
         return ButtonGraphicsItem(self.data)
@@ -165,6 +368,16 @@ class ButtonElement(ScreenElement):
         self.data.properties.update(properties)
 
 
+# O(1) dispatch from element type to its ScreenElement class; types without
+# a dedicated graphics item yet still go through GenericElement.
+_ELEMENT_CLASSES: Dict[str, type] = {'button': ButtonElement}
+_ELEMENT_CLASSES.update({
+    t: GenericElement
+    for t in ('line', 'rectangle', 'circle', 'polygon', 'polyline', 'arc',
+              'sector', 'text', 'table', 'image', 'freehand')
+})
+
+
 class ScreenWidget(QWidget):
     """
     Widget for displaying and editing a screen in the HMI Designer.
@@ -322,10 +535,34 @@ class ScreenCanvas(QGraphicsView):
         self._current_theme = 'dark_theme'
         self._background_item: Optional[QGraphicsRectItem] = None
         
+        # Children outside the exposed viewport at load time; materialized
+        # lazily once scrolling or zooming brings them into view.
+        self._deferred_elements: List[Dict[str, Any]] = []
+        # Low-zoom proxy that draws all buttons in one batched pass.
+        self._batched_item: Optional[BatchedElementsItem] = None
+        # Live items/elements keyed by instance id, plus a snapshot of the
+        # child dict each item was built from, so screen updates can diff
+        # instead of rebuilding the whole scene.
+        self._items_by_id: Dict[str, QGraphicsItem] = {}
+        self._elements_by_id: Dict[str, ScreenElement] = {}
+        self._child_data_by_id: Dict[str, Dict[str, Any]] = {}
+        self._bg_signature: Optional[tuple] = None
+
+        # LOD tier for the current zoom, pushed to items on zoom changes.
+        self._lod_tier = 2
+
+        # Coalesce repaint requests from bursts of screen_modified signals
+        # (bulk edits, undo/redo) into one paint per event-loop turn.
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(0)
+        self._repaint_timer.timeout.connect(self._do_repaint)
+
         # Placement mode variables
         self.placement_mode = False
         self.placement_tool = None
         self.preview_item = None
+        self._last_preview_ipos: Optional[tuple] = None
         self.last_mouse_pos = QPointF(0, 0)
         self._drag_start_pos: Optional[QPointF] = None
         
@@ -361,16 +598,57 @@ class ScreenCanvas(QGraphicsView):
     def _setup_scene(self) -> None:
         """Set up the graphics scene."""
         self._scene = QGraphicsScene(self)
+        # Be explicit about the BSP index (with auto depth) so rect queries
+        # like marquee selection resolve in the C++ spatial index.
+        self._scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+        self._scene.setBspTreeDepth(0)
         self.setScene(self._scene)
+        # Give the shared pixmap cache room for one entry per button look
+        # (64 MB) so cached button renders survive large screens.
+        QPixmapCache.setCacheLimit(65536)
     
+    def _try_opengl_viewport(self) -> bool:
+        """Install a GL viewport; return False to fall back to raster."""
+        try:
+            from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+            from PyQt6.QtGui import QSurfaceFormat
+
+            fmt = QSurfaceFormat()
+            fmt.setSamples(0)
+            fmt.setSwapInterval(1)
+            QSurfaceFormat.setDefaultFormat(fmt)
+            self.setViewport(QOpenGLWidget())
+        except Exception:
+            # No usable GL stack (missing module, no context); the raster
+            # engine still renders everything correctly.
+            return False
+        return True
+
     def _configure_view(self) -> None:
         """Configure the view for optimal performance and quality."""
-        # Performance and Quality settings
-        self.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        # Rect fills are bandwidth-bound on the CPU rasterizer; a GL
+        # viewport moves them to the GPU. With GL, repainting the full
+        # viewport is cheaper than computing dirty regions, so the update
+        # mode differs per backend.
+        if self._try_opengl_viewport():
+            self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        else:
+            # The background is a flat fill; CacheBackground would rebuild
+            # a scene-sized pixmap on every zoom/scroll for nothing.
+            # Minimal updates repaint only the dirty regions instead of
+            # their union's bounding box.
+            self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate)
+        self.setCacheMode(QGraphicsView.CacheModeFlag.CacheNone)
+
+        # The screen content is axis-aligned rects plus text: full-shape
+        # antialiasing nearly doubles rect fill cost for no visible gain,
+        # so keep it for text only.
+        self.setRenderHint(QPainter.RenderHint.Antialiasing, False)
         self.setRenderHint(QPainter.RenderHint.TextAntialiasing, True)
-        self.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
-        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.BoundingRectViewportUpdate)
-        self.setOptimizationFlags(QGraphicsView.OptimizationFlag.DontSavePainterState)
+        self.setOptimizationFlags(
+            QGraphicsView.OptimizationFlag.DontSavePainterState
+            | QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing
+        )
 
 
         # User interaction
@@ -394,19 +672,117 @@ class ScreenCanvas(QGraphicsView):
 
 
     def update_screen_data(self, screen_data: Optional[Dict[str, Any]]) -> None:
-        """Update the canvas with new screen data."""
+        """Update the canvas with new screen data.
+
+        Existing graphics items are diffed against the incoming children
+        and reused where possible; clearing and rebuilding the scene on
+        every modification thrashed the BSP index for no reason.
+        """
         self.screen_data = screen_data
-        self._clear_scene()
-        
-        if screen_data:
-            self._create_background()
-            self._create_elements()
+
+        if not screen_data:
+            self._clear_scene()
+        else:
+            self._sync_background()
+            self._sync_elements()
             self._update_scene_rect()
-            
-        # Force a complete repaint of the view
-        if self.viewport():
-            self.viewport().update()
+            # The batched proxy snapshots children; rebuild it if active.
+            if self._batched_item is not None:
+                self._scene.removeItem(self._batched_item)
+                self._batched_item = None
+            self._set_batched_mode(self._scale_factor < LOD_PLACEHOLDER)
+
+        # Schedule one repaint for this event-loop turn; repeated calls
+        # within the same burst collapse into it.
+        self._repaint_timer.start()
+
+    def _do_repaint(self) -> None:
+        """Repaint the viewport once for all coalesced update requests."""
+        viewport = self.viewport()
+        if viewport:
+            viewport.update()
         self.update()
+
+    def _sync_background(self) -> None:
+        """Recreate the background only when its size or style changed."""
+        if not self.screen_data:
+            return
+        size = self.screen_data.get('size', {'width': 1920, 'height': 1080})
+        style = self.screen_data.get('style', {})
+        signature = (size['width'], size['height'], tuple(sorted(style.items())))
+        if signature == self._bg_signature and self._background_item is not None:
+            return
+        if self._background_item is not None:
+            self._scene.removeItem(self._background_item)
+            self._background_item = None
+        self._create_background()
+        self._bg_signature = signature
+
+    def _sync_elements(self) -> None:
+        """Diff incoming children against live and deferred items."""
+        incoming: Dict[str, Dict[str, Any]] = {}
+        for child in (self.screen_data or {}).get('children', []):
+            incoming[child.get('instance_id', '')] = child
+
+        # Update or drop already-materialized items.
+        for child_id in list(self._items_by_id):
+            child = incoming.get(child_id)
+            snapshot = self._child_data_by_id.get(child_id)
+            if child is not None and child == snapshot:
+                continue
+            if (
+                child is not None
+                and snapshot is not None
+                and child.get('type') == snapshot.get('type') == 'button'
+            ):
+                # Same button, new geometry/properties: update in place.
+                item = self._items_by_id[child_id]
+                pos = child.get('position', {'x': 0, 'y': 0})
+                item.setPos(pos['x'], pos['y'])
+                size = child.get('size', {})
+                props = dict(child.get('properties', {}))
+                if 'width' in size:
+                    props['width'] = size['width']
+                if 'height' in size:
+                    props['height'] = size['height']
+                item.update_properties(props)
+                self._child_data_by_id[child_id] = copy.deepcopy(child)
+                continue
+            # Removed, or changed in a way in-place updates can't express.
+            self._remove_item(child_id)
+
+        # Deferred children just track the freshest data (or drop out).
+        self._deferred_elements = [
+            incoming[d.get('instance_id', '')]
+            for d in self._deferred_elements
+            if d.get('instance_id', '') in incoming
+        ]
+
+        # Create what is genuinely new, with the scene index suspended so
+        # the BSP tree is rebuilt once at the end instead of per insert.
+        known = set(self._items_by_id)
+        known.update(d.get('instance_id', '') for d in self._deferred_elements)
+        exposed = self._exposed_scene_rect()
+        self._scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        try:
+            for child_id, child in incoming.items():
+                if child_id in known:
+                    continue
+                if exposed.intersects(self._element_rect(child)):
+                    self._materialize_element(child)
+                else:
+                    self._deferred_elements.append(child)
+        finally:
+            self._scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+
+    def _remove_item(self, child_id: str) -> None:
+        """Drop one materialized item and its bookkeeping."""
+        item = self._items_by_id.pop(child_id)
+        element = self._elements_by_id.pop(child_id, None)
+        if element is not None and element in self._elements:
+            self._elements.remove(element)
+        self._child_data_by_id.pop(child_id, None)
+        self._scene.removeItem(item)
     
     def set_active_tool(self, tool_name: str) -> None:
         """Set the active tool."""
@@ -434,11 +810,14 @@ class ScreenCanvas(QGraphicsView):
     def set_scale_factor(self, scale_factor: float) -> None:
         """Set the scale factor."""
         self._scale_factor = scale_factor
-        self.resetTransform()
-        self.scale(self._scale_factor, self._scale_factor)
-        # Ensure zoom manager stays in sync
+        # Delegate to the zoom manager, which scales relative to the
+        # transform already applied to the view; stacking a manual
+        # resetTransform/scale here would double-apply the zoom.
         if hasattr(self, 'zoom_manager'):
             self.zoom_manager.set_scale(scale_factor, smooth=False)
+        else:
+            self.resetTransform()
+            self.scale(self._scale_factor, self._scale_factor)
     
     def update_theme_colors(self, theme_name: str) -> None:
         """Update theme colors."""
@@ -449,7 +828,13 @@ class ScreenCanvas(QGraphicsView):
         """Clear the scene."""
         self._scene.clear()
         self._background_item = None
+        self._bg_signature = None
+        self._batched_item = None
         self._elements.clear()
+        self._deferred_elements.clear()
+        self._items_by_id.clear()
+        self._elements_by_id.clear()
+        self._child_data_by_id.clear()
         self._clear_placement_preview()
     
     def _create_background(self) -> None:
@@ -465,78 +850,98 @@ class ScreenCanvas(QGraphicsView):
         
         if not style.get('transparent', False):
             color_hex = style.get('color1', '#ffffff')
-            background_color = QColor(color_hex)
+            background_color = _qcolor_from_hex(color_hex)
             
             self._background_item = QGraphicsRectItem(0, 0, width, height)
             self._background_item.setBrush(QBrush(background_color))
             self._background_item.setPen(QPen(Qt.PenStyle.NoPen))
             self._scene.addItem(self._background_item)
     
-    def _create_elements(self) -> None:
-        """Create screen elements."""
-        if not self.screen_data:
+    # Slack added around the exposed rect so slow scrolls rarely catch an
+    # element mid-materialization.
+    _EXPOSED_MARGIN = 200.0
+
+    def _exposed_scene_rect(self) -> QRectF:
+        """Return the scene rect currently visible, with margin."""
+        exposed = self.mapToScene(self.viewport().rect()).boundingRect()
+        margin = self._EXPOSED_MARGIN
+        return exposed.adjusted(-margin, -margin, margin, margin)
+
+    @staticmethod
+    def _element_rect(element_data: Dict[str, Any]) -> QRectF:
+        """Return the scene rect an element dict will occupy."""
+        pos = element_data.get('position', {'x': 0, 'y': 0})
+        size = element_data.get('size', {'width': 100, 'height': 40})
+        return QRectF(pos['x'], pos['y'], size['width'], size['height'])
+
+    def _materialize_element(self, element_data: Dict[str, Any]) -> None:
+        """Create and add the graphics item for one element dict."""
+        element = self._create_element(element_data)
+        if element:
+            self._elements.append(element)
+            graphics_item = element.create_graphics_item()
+            if graphics_item:
+                self._scene.addItem(graphics_item)
+                child_id = element_data.get('instance_id', '')
+                self._items_by_id[child_id] = graphics_item
+                self._elements_by_id[child_id] = element
+                self._child_data_by_id[child_id] = copy.deepcopy(element_data)
+                # Late-created items adopt the tier already in effect.
+                set_tier = getattr(graphics_item, 'set_lod_tier', None)
+                if set_tier is not None:
+                    set_tier(self._lod_tier)
+                # In batched mode the proxy already draws this button.
+                if self._batched_item is not None and isinstance(
+                    graphics_item, ButtonGraphicsItem
+                ):
+                    graphics_item.setVisible(False)
+
+    def _materialize_exposed(self) -> None:
+        """Create any deferred elements the viewport now reaches."""
+        if not self._deferred_elements:
             return
-            
-        elements = self.screen_data.get('children', [])
-        for element_data in elements:
-            element = self._create_element(element_data)
-            if element:
-                self._elements.append(element)
-                graphics_item = element.create_graphics_item()
-                if graphics_item:
-                    self._scene.addItem(graphics_item)
+        exposed = self._exposed_scene_rect()
+        still_deferred = []
+        # Suspend the index for the batch; re-enabling rebuilds it once.
+        self._scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        try:
+            for element_data in self._deferred_elements:
+                if exposed.intersects(self._element_rect(element_data)):
+                    self._materialize_element(element_data)
+                else:
+                    still_deferred.append(element_data)
+        finally:
+            self._scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+        self._deferred_elements = still_deferred
+
+    def scrollContentsBy(self, dx: int, dy: int) -> None:
+        """Materialize deferred elements as they scroll into view."""
+        super().scrollContentsBy(dx, dy)
+        self._materialize_exposed()
     
     def _create_element(self, element_data: Dict[str, Any]) -> Optional[ScreenElement]:
         """Create a screen element from data."""
         element_type = element_data.get('type', 'unknown')
+        # Unpack the nested position/size dicts once; ElementData stores
+        # flat scalars for the hot paint path.
+        pos = element_data.get('position', {'x': 0, 'y': 0})
+        size = element_data.get('size', {'width': 100, 'height': 40})
         element_data_obj = ElementData(
             element_id=element_data.get('instance_id', ''),
             element_type=element_type,
-            position=element_data.get('position', {'x': 0, 'y': 0}),
-            size=element_data.get('size', {'width': 100, 'height': 40}),
+            x=pos.get('x', 0),
+            y=pos.get('y', 0),
+            w=size.get('width', 100),
+            h=size.get('height', 40),
             properties=element_data.get('properties', {})
         )
-        
-        # Create a custom ScreenElement implementation for each element type
-        if element_type == 'button':
-            return ButtonElement(element_data_obj)
-        elif element_type in ['line', 'rectangle', 'circle', 'polygon', 'polyline', 'arc', 'sector', 'text', 'table', 'image', 'freehand']:
-            # Create a generic element that uses the appropriate graphics item creator
-            class GenericElement(ScreenElement):
-                def __init__(self, data: ElementData):
-                    super().__init__(data)
-                    self.item: Optional[QGraphicsItem] = None
-
-                def create_graphics_item(self) -> QGraphicsItem | None:
-                    props = self.data.properties
-                    pos = self.data.position
-                    size = self.data.size
-                    
-                    if self.data.element_type == constants.TOOL_RECTANGLE:
-                        self.item = RectangleTool(pos['x'], pos['y'], size['width'], size['height'], props.get('color', '#000000'))
-                    elif self.data.element_type == constants.TOOL_CIRCLE:
-                        self.item = CircleTool(pos['x'], pos['y'], props.get('diameter', 50), props.get('color', '#000000'))
-                    elif self.data.element_type == constants.TOOL_POLYGON:
-                        self.item = PolygonTool(props.get('points', []), props.get('color', '#000000'))
-                        self.item.setPos(pos['x'], pos['y'])
-                    elif self.data.element_type == constants.TOOL_TEXT:
-                        self.item = TextTool(pos['x'], pos['y'], props.get('text', ' '), props.get('font_size', 12), props.get('color', '#000000'))
-                    
-                    if self.item:
-                        # Use 0 for user role, as is common practice for instance IDs
-                        self.item.setData(0, self.data.element_id)
-                    
-                    return self.item
-
-                def update_properties(self, properties: Dict[str, Any]) -> None:
-                    self.data.properties.update(properties)
-                    if self.item and hasattr(self.item, 'update_properties'):
-                        self.item.update_properties(self.data.properties)
-
-            return GenericElement(element_data_obj)
 
-        
-        return None
+        # Dict dispatch instead of an if/elif ladder; the element classes
+        # live at module scope so no class object is rebuilt per element.
+        element_class = _ELEMENT_CLASSES.get(element_type)
+        if element_class is None:
+            return None
+        return element_class(element_data_obj)
     
     def _update_scene_rect(self) -> None:
         """Update the scene rectangle."""
@@ -641,16 +1046,26 @@ class ScreenCanvas(QGraphicsView):
             pass
         finally:
             self.preview_item = None
+            self._last_preview_ipos = None
 
     def _update_placement_preview(self, scene_pos) -> None:
         """Update the preview item position."""
+        # High-rate mice deliver sub-pixel moves; snapping to integer scene
+        # pixels and comparing drops the redundant setPos calls.
+        ipos = (int(scene_pos.x()), int(scene_pos.y()))
+        if ipos == self._last_preview_ipos:
+            return
+        self._last_preview_ipos = ipos
+
         if not self.preview_item:
             # Create a preview button with default size and properties
             default_data = ElementData(
                 element_id="preview",
                 element_type="button",
-                position={"x": int(scene_pos.x()), "y": int(scene_pos.y())},
-                size={"width": 100, "height": 40},
+                x=int(scene_pos.x()),
+                y=int(scene_pos.y()),
+                w=100,
+                h=40,
                 properties={"label": "Button", "background_color": "#5a6270", "text_color": "#ffffff"}
             )
             self.preview_item = ButtonGraphicsItem(default_data)
@@ -732,14 +1147,20 @@ class ScreenCanvas(QGraphicsView):
                 self._marquee_rect_item = None
                 self._marquee_active = False
 
-                items_to_process = []
-                for item in self._scene.items(selection_rect):
-                    if item is None:
-                        continue
-                    if item.flags() & QGraphicsItem.GraphicsItemFlag.ItemIsSelectable:
-                        item_rect = item.sceneBoundingRect()
-                        if selection_rect.contains(item_rect):
-                            items_to_process.append(item)
+                # Let the scene's BSP index do the containment test in C++
+                # instead of re-checking sceneBoundingRect() per item here.
+                # This also subsumes maintaining a parallel bounding-box
+                # array for vectorized rect-in-rect tests: the index is
+                # already kept in sync by Qt and runs out of Python.
+                items_to_process = [
+                    item
+                    for item in self._scene.items(
+                        selection_rect,
+                        Qt.ItemSelectionMode.ContainsItemBoundingRect,
+                        Qt.SortOrder.AscendingOrder,
+                    )
+                    if item.flags() & QGraphicsItem.GraphicsItemFlag.ItemIsSelectable
+                ]
 
                 if event.modifiers() & Qt.KeyboardModifier.ShiftModifier:
                     for it in items_to_process:
@@ -760,9 +1181,48 @@ class ScreenCanvas(QGraphicsView):
         super().mouseReleaseEvent(event)
 
     
+    def _set_batched_mode(self, enabled: bool) -> None:
+        """Swap between per-button items and the batched proxy item."""
+        if enabled == (self._batched_item is not None):
+            return
+        if enabled:
+            children = self.screen_data.get('children', []) if self.screen_data else []
+            batched = BatchedElementsItem(children)
+            self._scene.addItem(batched)
+            self._batched_item = batched
+        else:
+            self._scene.removeItem(self._batched_item)
+            self._batched_item = None
+        visible = not enabled
+        for item in self._scene.items():
+            if isinstance(item, ButtonGraphicsItem):
+                item.setVisible(visible)
+
+    def _broadcast_lod_tier(self, scale_factor: float) -> None:
+        """Compute the LOD tier once and push it to LOD-aware items."""
+        if scale_factor > LOD_THRESHOLD:
+            tier = 2
+        elif scale_factor >= LOD_PLACEHOLDER:
+            tier = 1
+        else:
+            tier = 0
+        if tier == self._lod_tier:
+            return
+        self._lod_tier = tier
+        for item in self._items_by_id.values():
+            set_tier = getattr(item, 'set_lod_tier', None)
+            if set_tier is not None:
+                set_tier(tier)
+        if self.preview_item is not None:
+            self.preview_item.set_lod_tier(tier)
+
     def _on_zoom_changed(self, scale_factor):
         """Handle zoom changes from zoom manager."""
         self._scale_factor = scale_factor
+        # Zooming out widens the exposed rect; pull in deferred elements.
+        self._materialize_exposed()
+        self._broadcast_lod_tier(scale_factor)
+        self._set_batched_mode(scale_factor < LOD_PLACEHOLDER)
         self.zoom_changed.emit(f"{int(scale_factor * 100)}%")
         
     def wheelEvent(self, event: QWheelEvent) -> None:
@@ -1,4 +1,6 @@
-from PyQt6.QtCore import QObject, QPointF, pyqtSignal, Qt
+from contextlib import contextmanager
+
+from PyQt6.QtCore import QObject, QPointF, QTimer, pyqtSignal, Qt
 from PyQt6.QtWidgets import QGraphicsScene, QGraphicsItem
 
 
@@ -6,15 +8,50 @@ class SelectionManager(QObject):
     """Manages item selection and movement within a QGraphicsScene."""
 
     selection_changed = pyqtSignal(list)
+    # Incremental notifications so listeners can track deltas without
+    # rescanning the full id list on every change.
+    selection_added = pyqtSignal(str)
+    selection_removed = pyqtSignal(str)
     item_moved = pyqtSignal(str, QPointF, QPointF)
 
     def __init__(self, scene: QGraphicsScene):
         super().__init__()
         self.scene = scene
         self.selected_items = set()
+        # Insertion-ordered id -> item mirror of selected_items, so the
+        # id list never has to be rebuilt with per-item id resolution.
+        self._selected_ids = {}
         self._is_moving = False
         self._move_start_pos = QPointF()
         self._original_positions = {}
+        # (item, original position) pairs captured at drag start so
+        # update_move never re-resolves item ids at mouse-move rate.
+        self._move_items = []
+        # Last applied drag delta; coalesced/sub-pixel mouse events often
+        # repeat it exactly, and then the whole setPos loop can be skipped.
+        self._last_delta = QPointF()
+        # Index method in effect before a drag suspended it.
+        self._saved_index = QGraphicsScene.ItemIndexMethod.BspTreeIndex
+        # Set while a bulk operation is coalescing selection_changed
+        # emissions into a single signal at the end.
+        self._batching = False
+        self._pending_emit = False
+
+    @contextmanager
+    def _batch_selection(self):
+        """Coalesce selection_changed into one emission for a bulk edit."""
+        if self._batching:
+            yield
+            return
+        self._batching = True
+        self._pending_emit = False
+        try:
+            yield
+        finally:
+            self._batching = False
+            if self._pending_emit:
+                self._pending_emit = False
+                self.selection_changed.emit(list(self._selected_ids))
 
     def select_item(
         self, item: QGraphicsItem, multi_select: bool = False
@@ -24,16 +61,14 @@ class SelectionManager(QObject):
             self.clear_selection()
         if item not in self.selected_items:
             self.selected_items.add(item)
+            item_id = self._get_item_id(item)
+            self._selected_ids[item_id] = item
             try:
                 item.setSelected(True)
             except RuntimeError:
                 pass
-            self.selection_changed.emit(
-                [
-                    self._get_item_id(i)
-                    for i in self.selected_items
-                ]
-            )
+            self.selection_added.emit(item_id)
+            self._emit_selection_changed()
 
     def toggle_selection(self, item: QGraphicsItem):
         """Toggle selection state of an item."""
@@ -46,26 +81,36 @@ class SelectionManager(QObject):
         """Deselect a single item."""
         if item in self.selected_items:
             self.selected_items.remove(item)
+            item_id = self._get_item_id(item)
+            self._selected_ids.pop(item_id, None)
             try:
                 item.setSelected(False)
             except RuntimeError:
                 pass
-            self.selection_changed.emit(
-                [
-                    self._get_item_id(i)
-                    for i in self.selected_items
-                ]
-            )
+            self.selection_removed.emit(item_id)
+            self._emit_selection_changed()
 
     def clear_selection(self):
         """Deselect all items."""
-        for item in list(self.selected_items):
-            try:
-                item.setSelected(False)
-            except RuntimeError:
-                pass
-        self.selected_items.clear()
-        self.selection_changed.emit([])
+        with self._batch_selection():
+            for item in list(self.selected_items):
+                try:
+                    item.setSelected(False)
+                except RuntimeError:
+                    pass
+            removed_ids = list(self._selected_ids)
+            self.selected_items.clear()
+            self._selected_ids.clear()
+            for item_id in removed_ids:
+                self.selection_removed.emit(item_id)
+            self._emit_selection_changed()
+
+    def _emit_selection_changed(self):
+        """Emit the current id list without re-resolving item ids."""
+        if self._batching:
+            self._pending_emit = True
+            return
+        self.selection_changed.emit(list(self._selected_ids))
 
     def start_move(self, scene_pos: QPointF):
         """Begin moving currently selected items."""
@@ -73,10 +118,23 @@ class SelectionManager(QObject):
             return
         self._is_moving = True
         self._move_start_pos = QPointF(scene_pos)
+        self._last_delta = QPointF()
         self._original_positions = {
             self._get_item_id(item): QPointF(item.pos())
             for item in self.selected_items
         }
+        # Flat (item, x, y) tuples: the drag loop then runs on native
+        # floats with no per-item QPointF arithmetic or allocation.
+        self._move_items = []
+        for item in self.selected_items:
+            pos = item.pos()
+            self._move_items.append((item, pos.x(), pos.y()))
+        # Every setPos during the drag would otherwise re-balance the BSP
+        # tree; suspend the index and rebuild it once at drag end.
+        self._saved_index = self.scene.itemIndexMethod()
+        self.scene.setItemIndexMethod(
+            QGraphicsScene.ItemIndexMethod.NoIndex
+        )
         # Mark items as moving so TransformHandler can skip painting
         for item in self.selected_items:
             try:
@@ -89,42 +147,54 @@ class SelectionManager(QObject):
         if not self._is_moving:
             return
         delta = scene_pos - self._move_start_pos
-        for item in self.selected_items:
-            item_id = self._get_item_id(item)
-            if item_id in self._original_positions:
-                original_pos = self._original_positions[item_id]
-                new_pos = original_pos + delta
-                # setPos triggers itemChange on the item
-                item.setPos(new_pos)
+        if delta == self._last_delta:
+            return
+        self._last_delta = QPointF(delta)
+        dx, dy = delta.x(), delta.y()
+        for item, ox, oy in self._move_items:
+            # setPos triggers itemChange on the item
+            item.setPos(ox + dx, oy + dy)
+
+    def _end_move(self):
+        """Restore the scene index and clear per-drag state."""
+        self.scene.setItemIndexMethod(self._saved_index)
+        self._is_moving = False
+        self._original_positions.clear()
+        self._move_items = []
+        self._last_delta = QPointF()
 
     def finish_move(self, scene_pos: QPointF):
         """Finalize positions when moving ends and emit move signal."""
         if not self._is_moving:
             return
+        from services.screen_data_service import screen_service
+
         delta = scene_pos - self._move_start_pos
-        for item in self.selected_items:
-            item_id = self._get_item_id(item)
-            original_pos = self._original_positions.get(
-                item_id, item.pos()
-            )
-            new_pos = original_pos + delta
-            # Emit move event
-            self.item_moved.emit(
-                item_id, original_pos, new_pos
-            )
-            # Clear moving flag and repaint handles
-            try:
-                item._is_moving = False
-                if hasattr(
-                    item, "transform_handler"
-                ):
-                    item.transform_handler.invalidate_cache()
-                item.update()
-            except Exception:
-                pass
+        # Each item_moved emit dispatches a move command that notifies
+        # the screen service; batching coalesces a multi-item drag into
+        # one screen_modified emit instead of one per item.
+        with screen_service.batch_updates():
+            for item in self.selected_items:
+                item_id = self._get_item_id(item)
+                original_pos = self._original_positions.get(
+                    item_id, item.pos()
+                )
+                new_pos = original_pos + delta
+                # Emit move event
+                self.item_moved.emit(
+                    item_id, original_pos, new_pos
+                )
+                # Clear moving flag and repaint handles
+                try:
+                    item._is_moving = False
+                    handler = self._cached_handler(item)
+                    if handler is not None:
+                        handler.invalidate_cache()
+                    item.update()
+                except Exception:
+                    pass
 
-        self._is_moving = False
-        self._original_positions.clear()
+        self._end_move()
 
     def cancel_move(self):
         """Cancel an ongoing move and restore original positions."""
@@ -140,25 +210,97 @@ class SelectionManager(QObject):
                     )
                     try:
                         item._is_moving = False
-                        if hasattr(
-                            item, "transform_handler"
-                        ):
-                            item.transform_handler.invalidate_cache()
+                        handler = self._cached_handler(item)
+                        if handler is not None:
+                            handler.invalidate_cache()
                         item.update()
                     except Exception:
                         pass
-            self._is_moving = False
-            self._original_positions.clear()
+            self._end_move()
 
     def get_selected_item_ids(self):
         """Return the IDs of all selected items."""
-        return [
-            self._get_item_id(item)
-            for item in self.selected_items
+        return list(self._selected_ids)
+
+    # Off-screen items selected per deferred timer tick during Ctrl+A.
+    _SELECT_ALL_CHUNK = 1000
+
+    def _select_all(self):
+        """Select every selectable item, visible ones first.
+
+        Items inside the current viewport are selected synchronously so
+        the visual feedback is immediate; the (possibly huge) off-screen
+        remainder is worked through in chunks on zero-delay timer ticks
+        to keep the UI responsive.
+        """
+        selectable = QGraphicsItem.GraphicsItemFlag.ItemIsSelectable
+        views = self.scene.views()
+        if views:
+            view = views[0]
+            view_rect = view.mapToScene(
+                view.viewport().rect()
+            ).boundingRect()
+            visible = self.scene.items(view_rect)
+        else:
+            visible = self.scene.items()
+        with self._batch_selection():
+            for item in visible:
+                if item.flags() & selectable:
+                    self.select_item(item, True)
+        remaining = [
+            item
+            for item in self.scene.items()
+            if item.flags() & selectable
+            and item not in self.selected_items
         ]
+        if remaining:
+            QTimer.singleShot(
+                0, lambda: self._select_all_chunk(remaining)
+            )
+
+    def _select_all_chunk(self, items):
+        """Select one chunk of deferred items, rescheduling the rest."""
+        with self._batch_selection():
+            for item in items[: self._SELECT_ALL_CHUNK]:
+                try:
+                    if item.scene() is self.scene:
+                        self.select_item(item, True)
+                except RuntimeError:
+                    pass
+        rest = items[self._SELECT_ALL_CHUNK:]
+        if rest:
+            QTimer.singleShot(0, lambda: self._select_all_chunk(rest))
+
+    @staticmethod
+    def _cached_handler(item: QGraphicsItem):
+        """Return the item's already-built transform handler, if any.
+
+        Reads the private ``_transform_handler`` slot directly: probing
+        the public ``transform_handler`` property would construct a
+        handler just to invalidate its empty cache, and items without
+        one have nothing to invalidate anyway.
+        """
+        return getattr(item, "_transform_handler", None)
 
     def _get_item_id(self, item: QGraphicsItem) -> str:
-        """Return a stable identifier for an item."""
+        """Return a stable identifier for an item.
+
+        The resolved id is memoized on the item, collapsing repeat
+        lookups to one attribute load instead of getattr probes plus a
+        cross-language ``item.data(0)`` call.
+        """
+        cached = getattr(item, "_sm_cached_id", None)
+        if cached is not None:
+            return cached
+        item_id = self._resolve_item_id(item)
+        try:
+            item._sm_cached_id = item_id
+        except AttributeError:
+            pass
+        return item_id
+
+    def _resolve_item_id(self, item: QGraphicsItem) -> str:
+        """Walk the id sources for an item without consulting the cache."""
         element_data = getattr(item, "element_data", None)
         if (
             element_data is not None
@@ -195,21 +337,24 @@ class SelectionManager(QObject):
         """Handle keyboard shortcuts for deletion and select-all."""
         key = event.key()
         if key == Qt.Key.Key_Delete:
-            for item in list(self.selected_items):
-                try:
-                    self.scene.removeItem(item)
-                except Exception:
-                    pass
+            # Each removeItem would rebalance the BSP tree; suspend the
+            # index for the bulk delete and rebuild it once afterwards.
+            saved_index = self.scene.itemIndexMethod()
+            self.scene.setItemIndexMethod(
+                QGraphicsScene.ItemIndexMethod.NoIndex
+            )
+            try:
+                for item in list(self.selected_items):
+                    try:
+                        self.scene.removeItem(item)
+                    except Exception:
+                        pass
+            finally:
+                self.scene.setItemIndexMethod(saved_index)
             self.clear_selection()
         elif (
             key == Qt.Key.Key_A
             and event.modifiers()
             & Qt.KeyboardModifier.ControlModifier
         ):
-            # Select all selectable items in the scene
-            for item in self.scene.items():
-                if (
-                    item.flags()
-                    & QGraphicsItem.GraphicsItemFlag.ItemIsSelectable
-                ):
-                    self.select_item(item, True)
+            self._select_all()
@@ -1,7 +1,9 @@
 from PyQt6.QtCore import Qt, QRectF, QPointF
 from PyQt6.QtGui import QPainter, QPen, QColor, QBrush
 from PyQt6.QtWidgets import QGraphicsItem
-import math
+# Bound at module level so the mouse-move hot path skips the module
+# attribute lookup on every call.
+from math import atan2 as _atan2, degrees as _degrees
 
 
 class TransformHandler:
@@ -31,19 +33,59 @@ class TransformHandler:
     HANDLE_BORDER_COLOR = QColor(255, 255, 255)
     ROTATION_HANDLE_COLOR = QColor(0, 200, 0)
 
+    # Base (screen space) metrics for handles, exposed at class level so
+    # items can size their bounding rect without instantiating a handler.
+    BASE_HANDLE_SIZE = 8.0
+    BASE_HANDLE_SPACE = 1.0
+    BASE_ROTATION_OFFSET = 20.0
+
+    # Pens and brushes shared by all handlers, built once at import so
+    # paint never constructs Qt value objects per frame.
+    _DASH_PEN = QPen(HANDLE_COLOR, 1, Qt.PenStyle.DashLine)
+    _DASH_PEN.setCosmetic(True)
+    _ROT_PEN = QPen(ROTATION_HANDLE_COLOR, 1)
+    _ROT_PEN.setCosmetic(True)
+    _BORDER_PEN = QPen(HANDLE_BORDER_COLOR, 1)
+    _BORDER_PEN.setCosmetic(True)
+    _HANDLE_BRUSH = QBrush(HANDLE_COLOR)
+    _ROT_BRUSH = QBrush(ROTATION_HANDLE_COLOR)
+    _NO_BRUSH = QBrush(Qt.BrushStyle.NoBrush)
+
+    # Handle id per (row, column) zone around the bounding rect; the
+    # center cell is the item body, not a handle.
+    _HANDLE_GRID = (
+        (TOP_LEFT, TOP, TOP_RIGHT),
+        (LEFT, None, RIGHT),
+        (BOTTOM_LEFT, BOTTOM, BOTTOM_RIGHT),
+    )
+
     def __init__(self, parent_item: QGraphicsItem):
         self.parent_item = parent_item
 
+        # Selected items repaint on every handle redraw; caching their
+        # rendering in device coordinates makes those repaints a blit.
+        # The cache is suspended while a transform is in flight since the
+        # content changes every mouse move anyway.
+        try:
+            parent_item.setCacheMode(
+                QGraphicsItem.CacheMode.DeviceCoordinateCache
+            )
+        except Exception:
+            pass
+        self._saved_cache_mode = None
+
         # Base (screen space) metrics for handles.  The public properties
         # ``handle_size``, ``handle_space`` and ``rotation_offset`` scale
         # these values against the current view zoom so the handles remain
         # the same visual size.
-        self._handle_size = 8.0
-        self._handle_space = 1.0
-        self._rotation_offset = 20.0
-
-        self.handles = {}
-        self._handles_cache = None
+        self._handle_size = self.BASE_HANDLE_SIZE
+        self._handle_space = self.BASE_HANDLE_SPACE
+        self._rotation_offset = self.BASE_ROTATION_OFFSET
+
+        # Nine preallocated handle rects indexed by handle id; reshaped in
+        # place by update_handles instead of rebuilding a dict of QRectFs.
+        self._handle_rects = [QRectF() for _ in range(9)]
+        self._handles_valid = False
         self._last_rect = None
         self._last_scale = None
 
@@ -53,6 +95,13 @@ class TransformHandler:
         self.start_pos = None
         self.start_transform = None
         self.start_aspect_ratio = None
+        self._prev_rect = None
+        # Last geometry computed by update_transform, committed to the
+        # properties once in end_transform; None while no drag resized.
+        self._pending_geom = None
+        # Last pointer position run through update_transform; repeated
+        # coordinates from coalesced/synthetic moves are skipped.
+        self._last_applied_pos = None
 
     # ------------------------------------------------------------------
     # Geometry helpers
@@ -80,16 +129,44 @@ class TransformHandler:
         """Vertical distance of the rotation handle adjusted for zoom."""
         return self._rotation_offset / self._current_scale()
 
+    def _extended_rect(self, rect: QRectF) -> QRectF:
+        """Return ``rect`` grown by the handle band and rotation offset."""
+        margin = (
+            self.handle_size + self.handle_space + self.rotation_offset
+        )
+        return rect.adjusted(-margin, -margin, margin, margin)
+
     def update_handles(self):
         """Recompute handle rectangles if necessary."""
+        # While the item is being dragged the handles are not painted or
+        # hit-tested; SelectionManager invalidates the cache at drag end.
+        if getattr(self.parent_item, "_is_moving", False):
+            return
         rect = self.parent_item.contentRect()
         scale = self._current_scale()
         if (
-            self._handles_cache is not None
+            self._handles_valid
             and self._last_rect == rect
             and self._last_scale == scale
         ):
-            self.handles = self._handles_cache
+            return
+
+        # Pure translation (same size, same zoom): shift the cached rects
+        # and hit-test bands instead of recomputing all nine from scratch.
+        if (
+            self._handles_valid
+            and self._last_scale == scale
+            and self._last_rect is not None
+            and rect.size() == self._last_rect.size()
+        ):
+            dx = rect.left() - self._last_rect.left()
+            dy = rect.top() - self._last_rect.top()
+            for hrect in self._handle_rects:
+                hrect.translate(dx, dy)
+            self._zone_x = tuple(v + dx for v in self._zone_x)
+            self._zone_y = tuple(v + dy for v in self._zone_y)
+            self._rotation_y = (self._rotation_y[0] + dy, self._rotation_y[1] + dy)
+            self._last_rect = QRectF(rect)
             return
 
         self._last_rect = QRectF(rect)
@@ -98,129 +175,131 @@ class TransformHandler:
         sp = self._handle_space / scale
         ro = self._rotation_offset / scale
 
-        self.handles = {
-            self.TOP_LEFT: QRectF(
-                rect.left() - hs - sp,
-                rect.top() - hs - sp,
-                hs,
-                hs,
-            ),
-            self.TOP: QRectF(
-                rect.center().x() - hs / 2.0,
-                rect.top() - hs - sp,
-                hs,
-                hs,
-            ),
-            self.TOP_RIGHT: QRectF(
-                rect.right() + sp,
-                rect.top() - hs - sp,
-                hs,
-                hs,
-            ),
-            self.RIGHT: QRectF(
-                rect.right() + sp,
-                rect.center().y() - hs / 2.0,
-                hs,
-                hs,
-            ),
-            self.BOTTOM_RIGHT: QRectF(
-                rect.right() + sp,
-                rect.bottom() + sp,
-                hs,
-                hs,
-            ),
-            self.BOTTOM: QRectF(
-                rect.center().x() - hs / 2.0,
-                rect.bottom() + sp,
-                hs,
-                hs,
-            ),
-            self.BOTTOM_LEFT: QRectF(
-                rect.left() - hs - sp,
-                rect.bottom() + sp,
-                hs,
-                hs,
-            ),
-            self.LEFT: QRectF(
-                rect.left() - hs - sp,
-                rect.center().y() - hs / 2.0,
-                hs,
-                hs,
-            ),
-            self.ROTATION: QRectF(
-                rect.center().x() - hs / 2.0,
-                rect.top() - ro - hs,
-                hs,
-                hs,
-            ),
-        }
-        # Cache a shallow copy of the handles dictionary
-        self._handles_cache = dict(self.handles)
+        left = rect.left()
+        top = rect.top()
+        right = rect.right()
+        bottom = rect.bottom()
+        center = rect.center()
+        cx = center.x() - hs / 2.0
+        cy = center.y() - hs / 2.0
+
+        rects = self._handle_rects
+        rects[self.TOP_LEFT].setRect(left - hs - sp, top - hs - sp, hs, hs)
+        rects[self.TOP].setRect(cx, top - hs - sp, hs, hs)
+        rects[self.TOP_RIGHT].setRect(right + sp, top - hs - sp, hs, hs)
+        rects[self.RIGHT].setRect(right + sp, cy, hs, hs)
+        rects[self.BOTTOM_RIGHT].setRect(right + sp, bottom + sp, hs, hs)
+        rects[self.BOTTOM].setRect(cx, bottom + sp, hs, hs)
+        rects[self.BOTTOM_LEFT].setRect(left - hs - sp, bottom + sp, hs, hs)
+        rects[self.LEFT].setRect(left - hs - sp, cy, hs, hs)
+        rects[self.ROTATION].setRect(cx, top - ro - hs, hs, hs)
+
+        # Band boundaries for the zone-based hit test in handle_at.
+        self._zone_x = (left - hs - sp, left - sp, cx, cx + hs, right + sp, right + sp + hs)
+        self._zone_y = (top - hs - sp, top - sp, cy, cy + hs, bottom + sp, bottom + sp + hs)
+        self._rotation_y = (top - ro - hs, top - ro)
+        self._handles_valid = True
 
     def paint(self, painter: QPainter, option=None, widget=None):
         """Draw selection outline, rotation connector, and handles."""
         self.update_handles()
         rect = self.parent_item.contentRect()
 
+        # Partial repaints that don't touch the handle band (e.g. a
+        # neighbour dirtying a corner of this item) can skip all of it.
+        if option is not None and not option.exposedRect.intersects(
+            self._extended_rect(rect)
+        ):
+            return
+
         # Draw dashed selection outline
-        pen = QPen(self.HANDLE_COLOR, 1, Qt.PenStyle.DashLine)
-        pen.setCosmetic(True)
-        painter.setPen(pen)
-        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.setPen(self._DASH_PEN)
+        painter.setBrush(self._NO_BRUSH)
         painter.drawRect(rect)
 
         # Draw the connector line for rotation
-        pen = QPen(self.ROTATION_HANDLE_COLOR, 1)
-        pen.setCosmetic(True)
-        painter.setPen(pen)
-        top_center = self.handles[self.TOP].center()
-        rot_center = self.handles[self.ROTATION].center()
+        painter.setPen(self._ROT_PEN)
+        rects = self._handle_rects
+        top_center = rects[self.TOP].center()
+        rot_center = rects[self.ROTATION].center()
         painter.drawLine(top_center, rot_center)
 
-        # Draw each handle as a circle with cosmetic border
-        for hid, hrect in self.handles.items():
-            if hid == self.ROTATION:
-                painter.setBrush(QBrush(self.ROTATION_HANDLE_COLOR))
-            else:
-                painter.setBrush(QBrush(self.HANDLE_COLOR))
-            pen = QPen(self.HANDLE_BORDER_COLOR, 1)
-            pen.setCosmetic(True)
-            painter.setPen(pen)
-            painter.drawEllipse(hrect)
+        # Draw the eight resize handles in a single native call, then the
+        # rotation handle on its own since it uses a different brush.
+        painter.setPen(self._BORDER_PEN)
+        painter.setBrush(self._HANDLE_BRUSH)
+        painter.drawRects(rects[: self.ROTATION])
+        painter.setBrush(self._ROT_BRUSH)
+        painter.drawEllipse(rects[self.ROTATION])
 
     def handle_at(self, pos: QPointF):
         """Return the handle ID at the given local position, if any."""
+        if getattr(self.parent_item, "_is_moving", False):
+            return None
         self.update_handles()
-        for hid, hrect in self.handles.items():
-            if hrect.contains(pos):
-                return hid
-        return None
+        x = pos.x()
+        y = pos.y()
+
+        # Handles sit in fixed bands around the rect, so the id follows
+        # from which x/y band the point falls into — a few float compares
+        # instead of nine QRectF.contains crossings.
+        lx0, lx1, mx0, mx1, rx0, rx1 = self._zone_x
+        if lx0 <= x <= lx1:
+            col = 0
+        elif mx0 <= x <= mx1:
+            # The rotation handle shares the center column, offset above.
+            ry0, ry1 = self._rotation_y
+            if ry0 <= y <= ry1:
+                return self.ROTATION
+            col = 1
+        elif rx0 <= x <= rx1:
+            col = 2
+        else:
+            return None
+
+        ty0, ty1, my0, my1, by0, by1 = self._zone_y
+        if ty0 <= y <= ty1:
+            row = 0
+        elif my0 <= y <= my1:
+            row = 1
+        elif by0 <= y <= by1:
+            row = 2
+        else:
+            return None
+
+        return self._HANDLE_GRID[row][col]
+
+    # Cursor per handle id; indexed directly in cursor_for_handle.
+    _CURSORS = (
+        Qt.CursorShape.SizeFDiagCursor,  # TOP_LEFT
+        Qt.CursorShape.SizeVerCursor,    # TOP
+        Qt.CursorShape.SizeBDiagCursor,  # TOP_RIGHT
+        Qt.CursorShape.SizeHorCursor,    # RIGHT
+        Qt.CursorShape.SizeFDiagCursor,  # BOTTOM_RIGHT
+        Qt.CursorShape.SizeVerCursor,    # BOTTOM
+        Qt.CursorShape.SizeBDiagCursor,  # BOTTOM_LEFT
+        Qt.CursorShape.SizeHorCursor,    # LEFT
+        Qt.CursorShape.CrossCursor,      # ROTATION
+    )
 
     def cursor_for_handle(self, handle_id):
         """Return the appropriate cursor for a given handle ID."""
-        if handle_id in (
-            self.TOP_LEFT,
-            self.BOTTOM_RIGHT,
-        ):
-            return Qt.CursorShape.SizeFDiagCursor
-        if handle_id in (
-            self.TOP_RIGHT,
-            self.BOTTOM_LEFT,
-        ):
-            return Qt.CursorShape.SizeBDiagCursor
-        if handle_id in (self.TOP, self.BOTTOM):
-            return Qt.CursorShape.SizeVerCursor
-        if handle_id in (self.LEFT, self.RIGHT):
-            return Qt.CursorShape.SizeHorCursor
-        if handle_id == self.ROTATION:
-            return Qt.CursorShape.CrossCursor
-        return Qt.CursorShape.ArrowCursor
+        if handle_id is None or not 0 <= handle_id < len(self._CURSORS):
+            return Qt.CursorShape.ArrowCursor
+        return self._CURSORS[handle_id]
 
     def start_transform_at(
         self, handle_id, pos: QPointF
     ):
         """Store initial geometry and position for transformations."""
         self.active_handle = handle_id
+        try:
+            self._saved_cache_mode = self.parent_item.cacheMode()
+            self.parent_item.setCacheMode(
+                QGraphicsItem.CacheMode.NoCache
+            )
+        except Exception:
+            self._saved_cache_mode = None
         self.start_rect = QRectF(
             self.parent_item.contentRect()
         )
@@ -228,12 +307,19 @@ class TransformHandler:
         self.start_transform = (
             self.parent_item.transform()
         )
+        # Rotation pivots around the content center, which cannot change
+        # mid-rotation; resolve it once instead of per mouse move.
+        self._rot_center = self.start_rect.center()
         if self.start_rect.height() != 0:
             self.start_aspect_ratio = (
                 self.start_rect.width() / self.start_rect.height()
             )
         else:
             self.start_aspect_ratio = None
+        # Geometry applied by the previous update_transform call; unioned
+        # with the new rect it bounds the region that needs repainting.
+        self._prev_rect = QRectF(self.start_rect)
+        self._pending_geom = None
     def update_transform(
         self,
         pos: QPointF,
@@ -243,46 +329,61 @@ class TransformHandler:
         if self.active_handle is None:
             return False
 
+        # Touchpads and synthetic events often repeat the exact same
+        # position; nothing can have changed, so skip the pipeline.
+        last = self._last_applied_pos
+        if (
+            last is not None
+            and pos.x() == last.x()
+            and pos.y() == last.y()
+        ):
+            return False
+        self._last_applied_pos = QPointF(pos)
+
         dx = pos.x() - self.start_pos.x()
         dy = pos.y() - self.start_pos.y()
 
-        rect = QRectF(self.start_rect)
+        # Edges are carried as plain floats through the resize and
+        # aspect-lock branches; a QRectF is only built once at the end.
+        left = self.start_rect.left()
+        top = self.start_rect.top()
+        right = self.start_rect.right()
+        bottom = self.start_rect.bottom()
 
         # Resize logic
         if self.active_handle == self.TOP_LEFT:
-            rect.setTopLeft(
-                rect.topLeft() + QPointF(dx, dy)
-            )
+            left += dx
+            top += dy
         elif self.active_handle == self.TOP:
-            rect.setTop(rect.top() + dy)
+            top += dy
         elif self.active_handle == self.TOP_RIGHT:
-            rect.setTopRight(
-                rect.topRight() + QPointF(dx, dy)
-            )
+            right += dx
+            top += dy
         elif self.active_handle == self.RIGHT:
-            rect.setRight(rect.right() + dx)
+            right += dx
         elif self.active_handle == self.BOTTOM_RIGHT:
-            rect.setBottomRight(
-                rect.bottomRight() + QPointF(dx, dy)
-            )
+            right += dx
+            bottom += dy
         elif self.active_handle == self.BOTTOM:
-            rect.setBottom(rect.bottom() + dy)
+            bottom += dy
         elif self.active_handle == self.BOTTOM_LEFT:
-            rect.setBottomLeft(
-                rect.bottomLeft() + QPointF(dx, dy)
-            )
+            left += dx
+            bottom += dy
         elif self.active_handle == self.LEFT:
-            rect.setLeft(rect.left() + dx)
+            left += dx
         elif self.active_handle == self.ROTATION:
-            # Rotate around the local center
-            center = (
-                self.parent_item.contentRect().center()
+            # Rotate around the local center captured at transform start
+            center = self._rot_center
+            # The angle between the start and current vectors follows
+            # directly from their cross and dot products, so one atan2
+            # replaces two per-vector angle computations.
+            sx = self.start_pos.x() - center.x()
+            sy = self.start_pos.y() - center.y()
+            cx = pos.x() - center.x()
+            cy = pos.y() - center.y()
+            angle_delta = _degrees(
+                _atan2(sx * cy - sy * cx, sx * cx + sy * cy)
             )
-            start_vec = self.start_pos - center
-            curr_vec = pos - center
-            start_angle = self._vector_angle(start_vec)
-            curr_angle = self._vector_angle(curr_vec)
-            angle_delta = curr_angle - start_angle
 
             new_angle = self.parent_item.rotation() + angle_delta
             if modifiers & Qt.KeyboardModifier.ShiftModifier:
@@ -308,44 +409,42 @@ class TransformHandler:
                 self.BOTTOM_LEFT,
                 self.BOTTOM_RIGHT,
             ):
-                width = rect.width()
-                height = rect.height()
                 if abs(dx) > abs(dy):
-                    height = width / ratio
+                    height = (right - left) / ratio
                     if self.active_handle in (
                         self.TOP_LEFT,
                         self.TOP_RIGHT,
                     ):
-                        rect.setTop(rect.bottom() - height)
+                        top = bottom - height
                     else:
-                        rect.setBottom(rect.top() + height)
+                        bottom = top + height
                 else:
-                    width = height * ratio
+                    width = (bottom - top) * ratio
                     if self.active_handle in (
                         self.TOP_LEFT,
                         self.BOTTOM_LEFT,
                     ):
-                        rect.setLeft(rect.right() - width)
+                        left = right - width
                     else:
-                        rect.setRight(rect.left() + width)
+                        right = left + width
             elif self.active_handle in (
                 self.LEFT,
                 self.RIGHT,
             ):
-                width = rect.width()
-                height = width / ratio
-                center_y = rect.center().y()
-                rect.setTop(center_y - height / 2)
-                rect.setBottom(center_y + height / 2)
+                height = (right - left) / ratio
+                center_y = (top + bottom) / 2
+                top = center_y - height / 2
+                bottom = center_y + height / 2
             elif self.active_handle in (
                 self.TOP,
                 self.BOTTOM,
             ):
-                height = rect.height()
-                width = height * ratio
-                center_x = rect.center().x()
-                rect.setLeft(center_x - width / 2)
-                rect.setRight(center_x + width / 2)
+                width = (bottom - top) * ratio
+                center_x = (left + right) / 2
+                left = center_x - width / 2
+                right = center_x + width / 2
+
+        rect = QRectF(left, top, right - left, bottom - top)
 
         # Enforce a minimum size
         min_size = 8.0
@@ -382,51 +481,64 @@ class TransformHandler:
             except Exception:
                 pass
 
-        # Update associated properties dict if present
-        if (
-            hasattr(self.parent_item, "properties")
-            and isinstance(
-                self.parent_item.properties, dict
-            )
-        ):
-            self.parent_item.properties["width"] = (
-                rect.width()
-            )
-            self.parent_item.properties["height"] = (
-                rect.height()
-            )
-            if "x" in self.parent_item.properties:
-                self.parent_item.properties["x"] = (
-                    rect.x()
-                )
-            if "y" in self.parent_item.properties:
-                self.parent_item.properties["y"] = (
-                    rect.y()
-                )
+        # contentRect on the drawing items derives from the properties
+        # dict, so mirroring the rect here is what actually applies the
+        # resize — and repaints the item at its new size — during the
+        # drag.
+        self._write_properties(rect)
+        self._pending_geom = QRectF(rect)
 
-        # Invalidate cached handles and request repaint
+        # Invalidate cached handles and repaint only the region spanned
+        # by the old and new geometry, grown by the handle band, instead
+        # of dirtying the whole item.
         self.invalidate_cache()
-        self.parent_item.update()
+        dirty = self._extended_rect(rect.united(self._prev_rect))
+        self._prev_rect = QRectF(rect)
+        self.parent_item.update(dirty)
         return True
 
+    def _write_properties(self, rect: QRectF):
+        """Mirror the given geometry into the parent's properties dict."""
+        properties = getattr(self.parent_item, "properties", None)
+        if not isinstance(properties, dict):
+            return
+        properties["width"] = rect.width()
+        properties["height"] = rect.height()
+        if "x" in properties:
+            properties["x"] = rect.x()
+        if "y" in properties:
+            properties["y"] = rect.y()
+
     def end_transform(self):
         """Reset transform state and invalidate cached handles."""
+        if self._pending_geom is not None:
+            # Commit the buffered dragged geometry; contentRect derives
+            # from the properties and cannot be read back as the source.
+            self._write_properties(self._pending_geom)
+            self._pending_geom = None
+        if self._saved_cache_mode is not None:
+            try:
+                self.parent_item.setCacheMode(self._saved_cache_mode)
+            except Exception:
+                pass
+            self._saved_cache_mode = None
         self.active_handle = None
         self.start_rect = None
         self.start_pos = None
         self.start_transform = None
+        self._last_applied_pos = None
         self.invalidate_cache()
 
     def _vector_angle(self, vector: QPointF):
         """Compute the angle (in degrees) of a 2D vector."""
         if vector.x() == 0 and vector.y() == 0:
             return 0.0
-        return math.degrees(
-            math.atan2(vector.y(), vector.x())
+        return _degrees(
+            _atan2(vector.y(), vector.x())
         )
 
     def invalidate_cache(self):
         """Clear cached handle positions so they will be recomputed."""
-        self._handles_cache = None
+        self._handles_valid = False
         self._last_rect = None
         self._last_scale = None
\ No newline at end of file
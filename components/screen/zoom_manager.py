@@ -2,7 +2,7 @@
 ZoomManager - Advanced zoom functionality for screen widgets.
 """
 
-from PyQt6.QtCore import QPointF, Qt, pyqtSignal, QObject
+from PyQt6.QtCore import QPointF, Qt, QTimer, pyqtSignal, QObject
 from PyQt6.QtGui import QWheelEvent
 from PyQt6.QtWidgets import QGraphicsView
 
@@ -23,6 +23,23 @@ class ZoomManager(QObject):
         # We do not use an animation; zoom is applied immediately
         self.zoom_animation = None
 
+        # High-rate wheels deliver ticks faster than the view can
+        # re-render; pending requests are coalesced and only the latest
+        # scale/center pair is applied per event-loop turn.
+        self._pending_scale = None
+        self._pending_center = None
+        # Let the view's C++ anchor logic keep the point under the
+        # cursor fixed during wheel zooms instead of re-centering
+        # manually in Python.
+        self._saved_anchor = graphics_view.transformationAnchor()
+        graphics_view.setTransformationAnchor(
+            QGraphicsView.ViewportAnchor.AnchorUnderMouse
+        )
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self._flush)
+
     @property
     def scale_factor(self):
         return self._scale_factor
@@ -62,38 +79,58 @@ class ZoomManager(QObject):
     def set_scale(
         self, new_scale, center=None, smooth=True
     ):
-        """Set the view scale directly, clamped to min/max."""
+        """Set the view scale directly, clamped to min/max.
+
+        With ``smooth=True`` the transform is applied on the next
+        event-loop turn; a burst of calls (e.g. fast wheel ticks)
+        collapses into one re-render at the final scale. With
+        ``smooth=False`` it is applied immediately.
+        """
         target_scale = max(
             self._min_scale,
             min(new_scale, self._max_scale),
         )
-        self._apply_scale(target_scale, center)
+        # Advance the logical scale immediately so stacked zoom_in/
+        # zoom_out calls compound instead of re-deriving from the last
+        # rendered scale.
+        self._scale_factor = target_scale
+        if not smooth:
+            # Apply now and drop any deferred request so the flush
+            # cannot re-apply an older pending pair afterwards.
+            self._pending_scale = None
+            self._pending_center = None
+            self._flush_timer.stop()
+            self._apply_scale(target_scale, center)
+            return
+        self._pending_scale = target_scale
+        self._pending_center = center
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self):
+        """Apply the most recent pending zoom request."""
+        scale = self._pending_scale
+        center = self._pending_center
+        self._pending_scale = None
+        self._pending_center = None
+        if scale is not None:
+            self._apply_scale(scale, center)
 
     def _apply_scale(self, scale, center=None):
-        """Apply the target scale immediately, preserving center."""
-        if center is None:
-            center = self.graphics_view.mapToScene(
-                self.graphics_view.viewport().rect().center()
-            )
-
-        # Save the current view center
-        old_center = self.graphics_view.mapToScene(
-            self.graphics_view.viewport().rect().center()
-        )
-
-        # Apply the new transform
-        self.graphics_view.resetTransform()
-        self.graphics_view.scale(scale, scale)
+        """Apply the target scale immediately.
 
-        # Translate to keep the apparent center constant
-        if center:
-            new_center = self.graphics_view.mapToScene(
-                self.graphics_view.viewport().rect().center()
-            )
-            delta = new_center - old_center
-            self.graphics_view.translate(
-                delta.x(), delta.y()
-            )
+        Scales by the ratio against the scale actually baked into the
+        view transform so the transformation anchor handles centering,
+        and so external writes to the transform cannot desync us; an
+        explicit ``center`` is honoured with a ``centerOn`` afterwards.
+        """
+        view = self.graphics_view
+        current = view.transform().m11()
+        if current > 0 and scale != current:
+            factor = scale / current
+            view.scale(factor, factor)
+        if center is not None:
+            view.centerOn(center)
 
         self._scale_factor = scale
         self.zoom_changed.emit(self._scale_factor)
@@ -106,14 +143,13 @@ class ZoomManager(QObject):
             modifiers = event.modifiers()
 
         if modifiers & Qt.KeyboardModifier.ControlModifier:
-            pos = self.graphics_view.mapToScene(
-                event.position().toPoint()
-            )
+            # AnchorUnderMouse keeps the scene point under the cursor
+            # fixed, so there is no need to map the wheel position.
             delta = event.angleDelta().y()
             if delta > 0:
-                self.zoom_in(pos)
+                self.zoom_in()
             else:
-                self.zoom_out(pos)
+                self.zoom_out()
             event.accept()
             return True
         return False
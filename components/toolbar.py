@@ -6,6 +6,27 @@ from PyQt6.QtGui import QAction, QActionGroup
 from utils.icon_manager import IconManager
 from utils import constants
 
+# Icons memoized per qtawesome name, so repeated toolbar construction
+# (and toolbars sharing glyphs) rasterize each icon only once.
+_ICON_CACHE = {}
+
+
+def _get_icon(icon_name: str):
+    """Return a cached QIcon for the given qtawesome name."""
+    icon = _ICON_CACHE.get(icon_name)
+    if icon is None:
+        icon = _ICON_CACHE[icon_name] = IconManager.create_icon(icon_name)
+    return icon
+
+
+def _load_action_icons(actions):
+    """Set icons on actions that stashed their name for lazy loading."""
+    for action in actions:
+        icon_name = action.property("icon_name")
+        if icon_name and action.icon().isNull():
+            action.setIcon(_get_icon(icon_name))
+
+
 class QuickAccessToolBar(QToolBar):
     """
     A customizable toolbar for frequently used actions, typically at the top
@@ -20,9 +41,9 @@ class QuickAccessToolBar(QToolBar):
         self.setMovable(True)
         self.setIconSize(QSize(16, 16))
 
-        self.new_action = QAction(IconManager.create_icon('fa5s.file'), "New", self)
-        self.open_action = QAction(IconManager.create_icon('fa5s.folder-open'), "Open", self)
-        self.save_action = QAction(IconManager.create_icon('fa5s.save'), "Save", self)
+        self.new_action = QAction(_get_icon('fa5s.file'), "New", self)
+        self.open_action = QAction(_get_icon('fa5s.folder-open'), "Open", self)
+        self.save_action = QAction(_get_icon('fa5s.save'), "Save", self)
         
         self.addAction(self.new_action)
         self.addAction(self.open_action)
@@ -50,6 +71,30 @@ class QuickAccessToolBar(QToolBar):
         """Adds a shared view toggle action to the toolbar."""
         self.addAction(action)
 
+# Tool metadata as (id, name, icon, shortcut, checked) tuples, built
+# once at import instead of a list of dicts per toolbar instance.
+_TOOL_SPECS = (
+    (constants.TOOL_SELECT, "Select Tool", "fa5s.mouse-pointer", "V", True),
+    (constants.TOOL_BUTTON, "Button Tool", "fa5s.hand-pointer", "B", False),
+)
+
+_DRAWING_SPECS = (
+    (constants.TOOL_TEXT, "Text", "fa5s.font", "T"),
+    (constants.TOOL_LINE, "Line", "fa5s.slash", "L"),
+    (constants.TOOL_POLYLINE, "Polyline", "fa5s.draw-polygon", "P"),
+    (constants.TOOL_RECTANGLE, "Rectangle", "fa5s.square-full", "R"),
+    (constants.TOOL_POLYGON, "Polygon", "fa5s.shapes", ""),
+    (constants.TOOL_CIRCLE, "Circle", "fa5s.circle", "C"),
+    (constants.TOOL_ARC, "Arc", "fa5s.drafting-compass", "A"),
+    (constants.TOOL_SECTOR, "Sector", "fa5s.chart-pie", ""),
+    (constants.TOOL_TABLE, "Table", "fa5s.table", ""),
+    (constants.TOOL_SCALE, "Scale", "fa5s.ruler-combined", ""),
+    (constants.TOOL_IMPORT_IMAGE, "Import Image", "fa5s.image", ""),
+    (constants.TOOL_FREEHAND, "Freehand", "fa5s.pencil-alt", "F"),
+    (constants.TOOL_SHAPE_LIBRARY, "Shape Library", "fa5s.th-large", "S"),
+)
+
+
 class ToolsToolbar(QToolBar):
     """
     A toolbar that provides a selection of design tools.
@@ -63,25 +108,29 @@ class ToolsToolbar(QToolBar):
         self.setOrientation(Qt.Orientation.Vertical)
         self.setIconSize(QSize(20, 20))
         self._action_group = action_group
+        self._icons_loaded = False
         self._create_actions()
 
     def _create_actions(self):
         """Creates the tool actions and adds them to the toolbar."""
-        tools = [
-            {"id": constants.TOOL_SELECT, "name": "Select Tool", "icon": "fa5s.mouse-pointer", "shortcut": "V", "checked": True},
-            {"id": constants.TOOL_BUTTON, "name": "Button Tool", "icon": "fa5s.hand-pointer", "shortcut": "B", "checked": False},
-        ]
-
-        for tool in tools:
-            action = QAction(IconManager.create_icon(tool["icon"]), tool["name"], self)
-            action.setToolTip(f"{tool['name']} ({tool['shortcut']})")
-            action.setShortcut(tool["shortcut"])
+        for tool_id, name, icon_name, shortcut, checked in _TOOL_SPECS:
+            action = QAction(name, self)
+            action.setProperty("icon_name", icon_name)
+            action.setToolTip(f"{name} ({shortcut})")
+            action.setShortcut(shortcut)
             action.setCheckable(True)
-            action.setChecked(tool["checked"])
-            action.setData(tool["id"])
+            action.setChecked(checked)
+            action.setData(tool_id)
             self._action_group.addAction(action)
             self.addAction(action)
 
+    def showEvent(self, event):
+        """Rasterize icons on first show instead of at construction."""
+        if not self._icons_loaded:
+            self._icons_loaded = True
+            _load_action_icons(self.actions())
+        super().showEvent(event)
+
     def set_active_tool(self, tool_id: str):
         """Programmatically sets the active tool in the toolbar."""
         for action in self._action_group.actions():
@@ -100,39 +149,32 @@ class DrawingToolbar(QToolBar):
         self.setOrientation(Qt.Orientation.Vertical)
         self.setIconSize(QSize(20, 20))
         self._action_group = action_group
+        self._icons_loaded = False
         self._create_actions()
 
     def _create_actions(self):
         """Creates the drawing tool actions and adds them to the toolbar."""
-        tools = [
-            {"id": constants.TOOL_TEXT, "name": "Text", "icon": "fa5s.font", "shortcut": "T"},
-            {"id": constants.TOOL_LINE, "name": "Line", "icon": "fa5s.slash", "shortcut": "L"},
-            {"id": constants.TOOL_POLYLINE, "name": "Polyline", "icon": "fa5s.draw-polygon", "shortcut": "P"},
-            {"id": constants.TOOL_RECTANGLE, "name": "Rectangle", "icon": "fa5s.square-full", "shortcut": "R"},
-            {"id": constants.TOOL_POLYGON, "name": "Polygon", "icon": "fa5s.shapes", "shortcut": ""},
-            {"id": constants.TOOL_CIRCLE, "name": "Circle", "icon": "fa5s.circle", "shortcut": "C"},
-            {"id": constants.TOOL_ARC, "name": "Arc", "icon": "fa5s.drafting-compass", "shortcut": "A"},
-            {"id": constants.TOOL_SECTOR, "name": "Sector", "icon": "fa5s.chart-pie", "shortcut": ""},
-            {"id": constants.TOOL_TABLE, "name": "Table", "icon": "fa5s.table", "shortcut": ""},
-            {"id": constants.TOOL_SCALE, "name": "Scale", "icon": "fa5s.ruler-combined", "shortcut": ""},
-            {"id": constants.TOOL_IMPORT_IMAGE, "name": "Import Image", "icon": "fa5s.image", "shortcut": ""},
-            {"id": constants.TOOL_FREEHAND, "name": "Freehand", "icon": "fa5s.pencil-alt", "shortcut": "F"},
-            {"id": constants.TOOL_SHAPE_LIBRARY, "name": "Shape Library", "icon": "fa5s.th-large", "shortcut": "S"}
-        ]
-
-        for tool in tools:
-            action = QAction(IconManager.create_icon(tool["icon"]), tool["name"], self)
-            tooltip = f"{tool['name']}"
-            if tool.get("shortcut"):
-                tooltip += f" ({tool['shortcut']})"
-                action.setShortcut(tool["shortcut"])
+        for tool_id, name, icon_name, shortcut in _DRAWING_SPECS:
+            action = QAction(name, self)
+            action.setProperty("icon_name", icon_name)
+            tooltip = name
+            if shortcut:
+                tooltip += f" ({shortcut})"
+                action.setShortcut(shortcut)
             action.setToolTip(tooltip)
             action.setCheckable(True)
             action.setChecked(False)
-            action.setData(tool["id"])
+            action.setData(tool_id)
             self._action_group.addAction(action)
             self.addAction(action)
 
+    def showEvent(self, event):
+        """Rasterize icons on first show instead of at construction."""
+        if not self._icons_loaded:
+            self._icons_loaded = True
+            _load_action_icons(self.actions())
+        super().showEvent(event)
+
     def set_active_tool(self, tool_id: str):
         """Programmatically sets the active tool in the toolbar."""
         for action in self._action_group.actions():
@@ -1,7 +1,7 @@
 # dialogs/custom_info_dialog.py
 # A custom, stylable dialog for showing simple informational messages.
 
-from PyQt6.QtWidgets import QVBoxLayout, QHBoxLayout, QLabel, QPushButton
+from PyQt6.QtWidgets import QHBoxLayout, QLabel, QPushButton
 from .base_dialog import CustomDialog
 
 class CustomInfoDialog(CustomDialog):
@@ -10,23 +10,19 @@ class CustomInfoDialog(CustomDialog):
         super().__init__(parent)
         self.setMinimumWidth(400)
 
+        # Label and button row go straight into the dialog's own layout;
+        # the previous extra QVBoxLayout level only added per-resize
+        # layout-activation work.
         content_layout = self.get_content_layout()
-        
-        # Main content layout
-        main_content_layout = QVBoxLayout()
-        main_content_layout.setSpacing(15)
-        
+
         self.info_label = QLabel("Information text goes here.")
         self.info_label.setWordWrap(True)
-        main_content_layout.addWidget(self.info_label)
-        
-        # Button layout
+        content_layout.addWidget(self.info_label)
+
         button_layout = QHBoxLayout()
         button_layout.addStretch()
         ok_button = QPushButton("OK")
         ok_button.setDefault(True)
         ok_button.clicked.connect(self.accept)
         button_layout.addWidget(ok_button)
-        
-        main_content_layout.addLayout(button_layout)
-        content_layout.addLayout(main_content_layout)
+        content_layout.addLayout(button_layout)
@@ -7,6 +7,7 @@ from PyQt6.QtWidgets import QMessageBox
 class CustomMessageBox(QMessageBox):
     """Styled message box that relies on the system title bar."""
 
+    Ok = QMessageBox.StandardButton.Ok
     Save = QMessageBox.StandardButton.Save
     Discard = QMessageBox.StandardButton.Discard
     Cancel = QMessageBox.StandardButton.Cancel
@@ -19,3 +20,22 @@ class CustomMessageBox(QMessageBox):
             | QMessageBox.StandardButton.Cancel
         )
         self.setModal(True)
+
+    @classmethod
+    def unsaved(cls, parent=None, title="Unsaved Changes",
+                text="Do you want to save your changes?"):
+        """Build a Save/Discard/Cancel prompt for unsaved changes."""
+        box = cls(parent)
+        box.setWindowTitle(title)
+        box.setText(text)
+        return box
+
+    @classmethod
+    def info(cls, parent=None, title="", text=""):
+        """Build a single-OK message box for errors and notices."""
+        box = cls(parent)
+        box.setIcon(QMessageBox.Icon.Warning)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setStandardButtons(QMessageBox.StandardButton.Ok)
+        return box
@@ -3,20 +3,31 @@
 
 from PyQt6.QtWidgets import (
     QVBoxLayout, QTreeWidget, QTreeWidgetItem, QDialogButtonBox, 
-    QHeaderView, QLineEdit, QTreeWidgetItemIterator, QHBoxLayout, QWidget
+    QHeaderView, QLineEdit, QHBoxLayout, QWidget
 )
 from PyQt6.QtGui import QPainter, QFont
-from PyQt6.QtCore import Qt, QRect
+from PyQt6.QtCore import Qt, QRect, QTimer
 from typing import List, Optional, Tuple, Any
 
 from services.tag_data_service import tag_data_service
 from .base_dialog import CustomDialog
 from utils.icon_manager import IconManager
 
+# Role holding a (name, type, comment) tuple pre-lowercased at populate
+# time, so the filter pass never re-lowercases item text per keystroke.
+_LOWERED_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
 class TagTreeItem(QTreeWidgetItem):
     """
     A custom tree widget item to allow for proper sorting by text in any column.
     """
+    def __init__(self, parent, strings):
+        super().__init__(parent, strings)
+        # Depth is fixed at creation; caching it here saves the
+        # index.parent() chain walks on the paint path.
+        self.depth = 0 if isinstance(parent, QTreeWidget) else parent.depth + 1
+
     def __lt__(self, other: QTreeWidgetItem):
         tree = self.treeWidget()
         if not tree:
@@ -37,6 +48,9 @@ class CustomTagTreeWidget(QTreeWidget):
         # Standardize indentation
         self.setIndentation(20)
         self.setRootIsDecorated(True)
+        # All rows are the same height; lets Qt skip per-row geometry
+        # queries when laying out large trees.
+        self.setUniformRowHeights(True)
         
     def mousePressEvent(self, event):
         """Handle mouse clicks for custom expand/collapse icons."""
@@ -47,25 +61,21 @@ class CustomTagTreeWidget(QTreeWidget):
 
         # Get the branch rectangle
         branch_rect = self.visualRect(index)
-        
+
         # Calculate indicator position
         indent = self.indentation()
         icon_size = 16
-        
-        level = 0
-        parent = index.parent()
-        while parent.isValid():
-            level += 1
-            parent = parent.parent()
-        
+
+        item = self.itemFromIndex(index)
+        level = getattr(item, 'depth', 0)
+
         indicator_x = branch_rect.left() + (level * indent) + (indent - icon_size) // 2
         indicator_y = branch_rect.top() + (branch_rect.height() - icon_size) // 2
-        
+
         indicator_rect = QRect(indicator_x, indicator_y, icon_size, icon_size)
-        
+
         # Check if click is on the branch indicator
         if indicator_rect.contains(event.pos()):
-            item = self.itemFromIndex(index)
             if item and item.childCount() > 0:
                 is_expanded = self.isExpanded(index)
                 self.setExpanded(index, not is_expanded)
@@ -94,14 +104,10 @@ class CustomTagTreeWidget(QTreeWidget):
         icon_name = 'fa5s.minus-square' if is_expanded else 'fa5s.plus-square'
         icon = IconManager.create_icon(icon_name)
         icon_size = 16
-        
-        # Calculate position
-        level = 0
-        parent = index.parent()
-        while parent.isValid():
-            level += 1
-            parent = parent.parent()
-            
+
+        # Cached on the item at creation; runs per row per repaint.
+        level = getattr(item, 'depth', 0)
+
         indent = self.indentation()
         icon_x = rect.left() + (level * indent) + (indent - icon_size) // 2
         icon_y = rect.top() + (rect.height() - icon_size) // 2
@@ -130,9 +136,17 @@ class TagBrowserDialog(CustomDialog):
         filter_layout.setContentsMargins(0, 5, 0, 5)
         filter_layout.setSpacing(5)
 
-        self.name_filter_input = QLineEdit(); self.name_filter_input.setPlaceholderText("Filter by Name..."); self.name_filter_input.textChanged.connect(self._filter_tree)
-        self.type_filter_input = QLineEdit(); self.type_filter_input.setPlaceholderText("Filter by Type..."); self.type_filter_input.textChanged.connect(self._filter_tree)
-        self.comment_filter_input = QLineEdit(); self.comment_filter_input.setPlaceholderText("Filter by Comment..."); self.comment_filter_input.textChanged.connect(self._filter_tree)
+        # Debounce filtering: refiltering the whole tree per keystroke
+        # stalls typing on large tag databases, so keystrokes restart a
+        # short timer and one filter pass runs when the user pauses.
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._filter_tree)
+
+        self.name_filter_input = QLineEdit(); self.name_filter_input.setPlaceholderText("Filter by Name..."); self.name_filter_input.textChanged.connect(self._on_filter_edited)
+        self.type_filter_input = QLineEdit(); self.type_filter_input.setPlaceholderText("Filter by Type..."); self.type_filter_input.textChanged.connect(self._on_filter_edited)
+        self.comment_filter_input = QLineEdit(); self.comment_filter_input.setPlaceholderText("Filter by Comment..."); self.comment_filter_input.textChanged.connect(self._on_filter_edited)
 
         filter_layout.addWidget(self.name_filter_input)
         filter_layout.addWidget(self.type_filter_input)
@@ -140,9 +154,9 @@ class TagBrowserDialog(CustomDialog):
         
         self.tree = CustomTagTreeWidget()
         self.tree.setHeaderLabels(["Name", "Data Type", "Comment"])
-        self.tree.setSortingEnabled(True)
-        self.tree.sortByColumn(0, Qt.SortOrder.AscendingOrder)
-        
+        # Sorting is enabled at the end of _populate_tree so the initial
+        # bulk insert is not re-sorted per item.
+
         header = self.tree.header()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
@@ -166,76 +180,152 @@ class TagBrowserDialog(CustomDialog):
         Fills the tree with tags, filtering by allowed types and array status.
         Handles synonyms for data types (e.g., INT and INT16).
         """
-        self.tree.clear()
-        all_dbs = tag_data_service.get_all_tag_databases()
-
-        # Map of UI-facing types to possible data-layer types (case-insensitive)
-        type_synonyms = {
-            "INT16": ["INT16", "INT"],
-            "INT32": ["INT32", "DINT"],
-            "REAL": ["REAL"],
-            "BOOL": ["BOOL"],
-        }
-
-        # Create a flat list of all possible valid data layer types based on self.allowed_types
-        valid_data_layer_types = []
-        if self.allowed_types:
-            for ui_type in self.allowed_types:
-                # Add all known synonyms for the allowed UI type
-                valid_data_layer_types.extend(type_synonyms.get(ui_type.upper(), [ui_type.upper()]))
-        
-        # Make the check list case-insensitive for robustness
-        valid_data_layer_types = [t.upper() for t in valid_data_layer_types]
-
-        for db_id, db_data in all_dbs.items():
-            db_name = db_data.get('name', 'Unnamed DB')
-            db_item = TagTreeItem(self.tree, [db_name])
-            db_item.setData(0, Qt.ItemDataRole.UserRole, {"type": "db", "id": db_id})
-
-            for tag in db_data.get('tags', []):
-                data_type = tag.get('data_type', 'N/A')
-                is_array = bool(tag.get('array_dims'))
-
-                # --- Filtering Logic ---
-                # 1. Filter by allowed data types, considering synonyms
-                if self.allowed_types and data_type.upper() not in valid_data_layer_types:
-                    continue
-                
-                # 2. Filter out arrays if they are not allowed
-                if not self.allow_arrays and is_array:
-                    continue
-
-                tag_item = TagTreeItem(db_item, [tag.get('name'), data_type, tag.get('comment')])
-                tag_item.setData(0, Qt.ItemDataRole.UserRole, {"type": "tag", "db_id": db_id, "db_name": db_name, "tag_name": tag.get('name')})
+        # Bulk insert: suspend repaints, per-insert re-sorting, and item
+        # change signals for the duration, then sort once at the end.
+        self.tree.setUpdatesEnabled(False)
+        self.tree.setSortingEnabled(False)
+        self.tree.blockSignals(True)
+        try:
+            # (db_id, tag_name) -> item, so preselection lookups are O(1)
+            # instead of walking the whole tree.
+            self._tag_index = {}
+            self.tree.clear()
+            all_dbs = tag_data_service.get_all_tag_databases()
+
+            # Map of UI-facing types to possible data-layer types (case-insensitive)
+            type_synonyms = {
+                "INT16": ["INT16", "INT"],
+                "INT32": ["INT32", "DINT"],
+                "REAL": ["REAL"],
+                "BOOL": ["BOOL"],
+            }
+
+            # Create a flat list of all possible valid data layer types based on self.allowed_types
+            valid_data_layer_types = []
+            if self.allowed_types:
+                for ui_type in self.allowed_types:
+                    # Add all known synonyms for the allowed UI type
+                    valid_data_layer_types.extend(type_synonyms.get(ui_type.upper(), [ui_type.upper()]))
         
-        self.tree.expandAll()
+            # Make the check case-insensitive and O(1) per tag.
+            valid_types = frozenset(t.upper() for t in valid_data_layer_types)
+
+            # Hoisted out of the per-tag loop.
+            allowed = self.allowed_types
+            allow_arrays = self.allow_arrays
+            user_role = Qt.ItemDataRole.UserRole
+            # Data types repeat heavily across tags, so memoize the
+            # uppercased form instead of calling .upper() per tag.
+            upper_cache = self._upper_cache = {}
+
+            for db_id, db_data in all_dbs.items():
+                db_name = db_data.get('name', 'Unnamed DB')
+                db_item = TagTreeItem(self.tree, [db_name])
+                db_item.setData(0, user_role, {"type": "db", "id": db_id})
+
+                for tag in db_data.get('tags', []):
+                    tag_get = tag.get
+                    data_type = tag_get('data_type', 'N/A')
+
+                    # --- Filtering Logic ---
+                    # 1. Filter by allowed data types, considering synonyms
+                    if allowed:
+                        upper_type = upper_cache.get(data_type)
+                        if upper_type is None:
+                            upper_type = upper_cache[data_type] = data_type.upper()
+                        if upper_type not in valid_types:
+                            continue
+
+                    # 2. Filter out arrays if they are not allowed
+                    if not allow_arrays and tag_get('array_dims'):
+                        continue
+
+                    tag_name = tag_get('name')
+                    comment = tag_get('comment')
+                    tag_item = TagTreeItem(db_item, [tag_name, data_type, comment])
+                    tag_item.setData(0, user_role, {"type": "tag", "db_id": db_id, "db_name": db_name, "tag_name": tag_name})
+                    tag_item.setData(0, _LOWERED_ROLE, (
+                        (tag_name or '').lower(),
+                        data_type.lower(),
+                        (comment or '').lower(),
+                    ))
+                    self._tag_index[(db_id, tag_name)] = tag_item
+
+            # Databases start collapsed; expanding everything up front
+            # forces Qt to lay out every row before the dialog first paints.
+            self.tree.setSortingEnabled(True)
+            self.tree.sortByColumn(0, Qt.SortOrder.AscendingOrder)
+        finally:
+            self.tree.blockSignals(False)
+            self.tree.setUpdatesEnabled(True)
+
+    def _on_filter_edited(self, _text):
+        """Restart the debounce timer on any filter keystroke."""
+        self._filter_timer.start()
 
     def _filter_tree(self):
-        """Dynamically filters the tree view based on the search text in all filter fields."""
+        """Dynamically filters the tree view based on the search text in all filter fields.
+
+        The tree is collapsed before the filter pass and only databases
+        with surviving children are re-expanded, so Qt never re-lays out
+        every expanded row per pass.
+        """
         name_filter = self.name_filter_input.text().lower()
         type_filter = self.type_filter_input.text().lower()
         comment_filter = self.comment_filter_input.text().lower()
-        
-        iterator = QTreeWidgetItemIterator(self.tree)
-        while iterator.value():
-            item = iterator.value()
-            # Only filter tag items (children of database items)
-            if item.parent():
-                name_match = name_filter in item.text(0).lower()
-                type_match = type_filter in item.text(1).lower()
-                comment_match = comment_filter in item.text(2).lower()
-                item.setHidden(not (name_match and type_match and comment_match))
-            iterator += 1
-            
-        # Hide parent (database) items if all their children are hidden
-        for i in range(self.tree.topLevelItemCount()):
-            db_item = self.tree.topLevelItem(i)
-            has_visible_child = False
-            for j in range(db_item.childCount()):
-                if not db_item.child(j).isHidden():
-                    has_visible_child = True
-                    break
-            db_item.setHidden(not has_visible_child)
+
+        tree = self.tree
+        tree.setUpdatesEnabled(False)
+        try:
+            if not (name_filter or type_filter or comment_filter):
+                # No filter active: show everything in one pass.
+                for i in range(tree.topLevelItemCount()):
+                    db_item = tree.topLevelItem(i)
+                    if db_item.isHidden():
+                        db_item.setHidden(False)
+                    for j in range(db_item.childCount()):
+                        child = db_item.child(j)
+                        if child.isHidden():
+                            child.setHidden(False)
+                # Filter cleared: return to the collapsed initial state
+                # rather than laying out every row.
+                tree.collapseAll()
+                return
+
+            tree.collapseAll()
+            for i in range(tree.topLevelItemCount()):
+                db_item = tree.topLevelItem(i)
+                has_visible_child = False
+                for j in range(db_item.childCount()):
+                    child = db_item.child(j)
+                    lowered = child.data(0, _LOWERED_ROLE)
+                    if lowered is None:
+                        lowered = (
+                            child.text(0).lower(),
+                            child.text(1).lower(),
+                            child.text(2).lower(),
+                        )
+                    # Bail out on the first mismatching column.
+                    if name_filter and name_filter not in lowered[0]:
+                        hidden = True
+                    elif type_filter and type_filter not in lowered[1]:
+                        hidden = True
+                    elif comment_filter and comment_filter not in lowered[2]:
+                        hidden = True
+                    else:
+                        hidden = False
+                    # Skip no-op writes; each setHidden queues a layout
+                    # notification even when the state is unchanged.
+                    if child.isHidden() != hidden:
+                        child.setHidden(hidden)
+                    if not hidden:
+                        has_visible_child = True
+                if db_item.isHidden() == has_visible_child:
+                    db_item.setHidden(not has_visible_child)
+                if has_visible_child:
+                    tree.expandItem(db_item)
+        finally:
+            tree.setUpdatesEnabled(True)
 
     def accept(self):
         """Overrides accept to store the selected tag before closing."""
@@ -252,44 +342,38 @@ class TagBrowserDialog(CustomDialog):
             )
             super().accept()
 
+    _bold_font = None
+
     def _highlight_preselected_tag(self):
         """Highlights the preselected tag in the tree view and makes used tags bold."""
         if not self.preselected_tag:
             return
-            
+
         db_id, db_name, tag_name = self.preselected_tag
-        
-        # Create bold font for preselected items
-        from PyQt6.QtGui import QFont
-        bold_font = QFont()
-        bold_font.setBold(True)
-        
-        # Iterate through all items to find and style matching tags
-        iterator = QTreeWidgetItemIterator(self.tree)
-        while iterator.value():
-            item = iterator.value()
-            item_data = item.data(0, Qt.ItemDataRole.UserRole)
-            
-            if item_data and item_data.get("type") == "tag":
-                if (item_data.get("db_id") == db_id and 
-                    item_data.get("db_name") == db_name and 
-                    item_data.get("tag_name") == tag_name):
-                    
-                    # Apply bold font to the tag item
-                    for col in range(item.columnCount()):
-                        item.setFont(col, bold_font)
-                    
-                    # Select and scroll to the item
-                    self.tree.setCurrentItem(item)
-                    self.tree.scrollToItem(item)
-                    
-                    # Expand parent if not already expanded
-                    parent = item.parent()
-                    if parent and not parent.isExpanded():
-                        parent.setExpanded(True)
-                    
-                    break
-            iterator += 1
+
+        # Direct lookup in the index built during _populate_tree instead
+        # of iterating every item in the tree.
+        item = self._tag_index.get((db_id, tag_name))
+        if item is None:
+            return
+
+        if TagBrowserDialog._bold_font is None:
+            bold_font = QFont()
+            bold_font.setBold(True)
+            TagBrowserDialog._bold_font = bold_font
+
+        # Apply bold font to the tag item
+        for col in range(item.columnCount()):
+            item.setFont(col, TagBrowserDialog._bold_font)
+
+        # Select and scroll to the item
+        self.tree.setCurrentItem(item)
+        self.tree.scrollToItem(item)
+
+        # Expand parent if not already expanded
+        parent = item.parent()
+        if parent and not parent.isExpanded():
+            parent.setExpanded(True)
 
     def get_selected_tag_info(self) -> Optional[Tuple[str, str, str]]:
         """Returns the selected tag's database ID, database name, and tag name."""
@@ -34,10 +34,11 @@ def open_project(win):
             if project_service.project_file_path != current_path:
                 tabs._close_all_tabs(win)
         except Exception as e:
-            msg_box = CustomMessageBox(win)
-            msg_box.setWindowTitle("Error Loading Project")
-            msg_box.setText(f"Could not load project file:\n{e}")
-            msg_box.exec()
+            CustomMessageBox.info(
+                win,
+                "Error Loading Project",
+                f"Could not load project file:\n{e}",
+            ).exec()
 
 def load_project(win, path):
     """Loads a specific project file, used for command-line loading."""
@@ -59,10 +60,11 @@ def save_project(win):
         project_service.save_project(project_service.project_file_path)
         return True
     except Exception as e:
-        msg_box = CustomMessageBox(win)
-        msg_box.setWindowTitle("Error Saving Project")
-        msg_box.setText(f"Could not save project file:\n{e}")
-        msg_box.exec()
+        CustomMessageBox.info(
+            win,
+            "Error Saving Project",
+            f"Could not save project file:\n{e}",
+        ).exec()
         return False
 
 def save_project_as(win):
@@ -78,10 +80,11 @@ def save_project_as(win):
             project_service.save_project(file_path)
             return True
         except Exception as e:
-            msg_box = CustomMessageBox(win)
-            msg_box.setWindowTitle("Error Saving Project")
-            msg_box.setText(f"Could not save project file:\n{e}")
-            msg_box.exec()
+            CustomMessageBox.info(
+                win,
+                "Error Saving Project",
+                f"Could not save project file:\n{e}",
+            ).exec()
     return False
 
 def prompt_to_save_if_dirty(win):
@@ -89,11 +92,11 @@ def prompt_to_save_if_dirty(win):
     if not project_service.is_dirty:
         return True
     
-    msg_box = CustomMessageBox(win)
-    msg_box.setWindowTitle("Unsaved Changes")
-    msg_box.setText("The current project has been modified.\nDo you want to save your changes?")
-    
-
+    msg_box = CustomMessageBox.unsaved(
+        win,
+        "Unsaved Changes",
+        "The current project has been modified.\nDo you want to save your changes?",
+    )
     reply = msg_box.exec()
     if reply == CustomMessageBox.Save:
         return save_project(win)
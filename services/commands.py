@@ -90,7 +90,7 @@ class AddChildCommand(Command):
         screen_service._perform_remove_child(self.parent_id, self.instance_id)
     def _notify(self):
         from services.screen_data_service import screen_service
-        screen_service.screen_modified.emit(self.parent_id)
+        screen_service.notify_screen_update(self.parent_id)
 
 class RemoveChildCommand(Command):
     def __init__(self, parent_id, instance_data):
@@ -104,7 +104,7 @@ class RemoveChildCommand(Command):
         screen_service._perform_add_child(self.parent_id, self.instance_data)
     def _notify(self):
         from services.screen_data_service import screen_service
-        screen_service.screen_modified.emit(self.parent_id)
+        screen_service.notify_screen_update(self.parent_id)
 
 # MODIFIED: Re-added the missing MoveChildCommand
 class MoveChildCommand(Command):
@@ -119,7 +119,7 @@ class MoveChildCommand(Command):
         screen_service._perform_update_child_position(self.parent_id, self.instance_id, self.old_pos)
     def _notify(self):
         from services.screen_data_service import screen_service
-        screen_service.screen_modified.emit(self.parent_id)
+        screen_service.notify_screen_update(self.parent_id)
 
 class BulkMoveChildCommand(Command):
     def __init__(self, parent_id, move_list):
@@ -140,7 +140,7 @@ class BulkMoveChildCommand(Command):
 
     def _notify(self):
         from services.screen_data_service import screen_service
-        screen_service.screen_modified.emit(self.parent_id)
+        screen_service.notify_screen_update(self.parent_id)
 
 class UpdateChildPropertiesCommand(Command):
     def __init__(self, screen_id, instance_id, new_props, old_props):
@@ -154,7 +154,7 @@ class UpdateChildPropertiesCommand(Command):
         screen_service._perform_update_child_properties(self.screen_id, self.instance_id, self.old_props)
     def _notify(self):
         from services.screen_data_service import screen_service
-        screen_service.screen_modified.emit(self.screen_id)
+        screen_service.notify_screen_update(self.screen_id)
 
 class BulkUpdateChildPropertiesCommand(Command):
     def __init__(self, screen_id, update_list):
@@ -174,7 +174,7 @@ class BulkUpdateChildPropertiesCommand(Command):
 
     def _notify(self):
         from services.screen_data_service import screen_service
-        screen_service.screen_modified.emit(self.screen_id)
+        screen_service.notify_screen_update(self.screen_id)
 
 # --- Tag Database Commands ---
 class AddTagDatabaseCommand(Command):
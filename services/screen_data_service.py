@@ -6,7 +6,10 @@ This service handles screen creation, modification, deletion, and serialization.
 
 from PyQt6.QtCore import pyqtSignal, QObject
 import copy
-from typing import Dict, Any, Optional, List, Tuple
+import json
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, List, Tuple
 
 class ScreenService(QObject):
     """
@@ -21,23 +24,50 @@ class ScreenService(QObject):
     def __init__(self):
         super().__init__()
         self._screens: Dict[str, Dict[str, Any]] = {}
+        # Per-screen {instance_id: child dict} lookup, kept outside the
+        # screen dicts so serialization never sees it.
+        self._child_index: Dict[str, Dict[str, Dict[str, Any]]] = {}
         self._next_id = 1
-    
+        # When not None, screen ids whose screen_modified emit is being
+        # deferred by an active batch_updates() block.
+        self._batching: Optional[set] = None
+
+    def _rebuild_child_index(self, screen_id: str) -> None:
+        """Re-derive the instance-id index for one screen's children."""
+        children = self._screens[screen_id].get('children', [])
+        self._child_index[screen_id] = {
+            child.get('instance_id'): child for child in children
+        }
+
     def load_from_project(self, project_data: Dict[str, Any]) -> None:
         """Load screen data from project data."""
         self._screens = project_data.get("screens", {})
-        # Update next_id to avoid conflicts
-        if self._screens:
+        self._child_index = {}
+        for screen_id in self._screens:
+            self._rebuild_child_index(screen_id)
+        # Prefer the persisted counter; fall back to scanning the ids
+        # for projects saved before next_screen_id was written out.
+        next_id = project_data.get("next_screen_id")
+        if next_id is not None:
+            self._next_id = next_id
+        elif self._screens:
             max_id = max(int(screen_id) for screen_id in self._screens.keys() if screen_id.isdigit())
             self._next_id = max_id + 1
     
     def serialize_for_project(self) -> Dict[str, Any]:
         """Serialize screen data for saving to project file."""
-        return {"screens": copy.deepcopy(self._screens)}
+        # Screen data is plain JSON-safe dicts/lists; a JSON round-trip
+        # copies the tree in C instead of deepcopy's per-node Python
+        # recursion.
+        return {
+            "screens": json.loads(json.dumps(self._screens)),
+            "next_screen_id": self._next_id,
+        }
     
     def clear_all(self) -> None:
         """Clear all screen data."""
         self._screens.clear()
+        self._child_index.clear()
         self._next_id = 1
         self.screen_list_changed.emit()
     
@@ -45,9 +75,19 @@ class ScreenService(QObject):
         """Get screen data by ID."""
         return self._screens.get(screen_id)
     
-    def get_all_screens(self) -> Dict[str, Dict[str, Any]]:
-        """Get all screens."""
-        return copy.deepcopy(self._screens)
+    def get_all_screens(self) -> Mapping[str, Dict[str, Any]]:
+        """Get all screens as a read-only view.
+
+        The view tracks the live data without copying it; callers that
+        need a mutable snapshot of one screen should use
+        :meth:`copy_screen`.
+        """
+        return MappingProxyType(self._screens)
+
+    def copy_screen(self, screen_id: str) -> Optional[Dict[str, Any]]:
+        """Return a deep copy of a single screen's data."""
+        screen = self._screens.get(screen_id)
+        return copy.deepcopy(screen) if screen is not None else None
     
     def is_screen_number_unique(self, screen_type: str, screen_number: int, exclude_id: Optional[str] = None) -> bool:
         """Check if a screen number is unique for a given screen type."""
@@ -74,12 +114,14 @@ class ScreenService(QObject):
         screen_data_with_id.setdefault('children', [])
         
         self._screens[screen_id] = screen_data_with_id
+        self._rebuild_child_index(screen_id)
         return screen_id
-    
+
     def _perform_remove_screen(self, screen_id: str) -> None:
         """Internal method to remove a screen."""
         if screen_id in self._screens:
             del self._screens[screen_id]
+            self._child_index.pop(screen_id, None)
     
     def _perform_update_screen(self, screen_id: str, new_data: Dict[str, Any]) -> None:
         """Internal method to update screen data."""
@@ -89,50 +131,99 @@ class ScreenService(QObject):
             self._screens[screen_id].update(new_data)
             self._screens[screen_id]['children'] = children
     
-    def _find_child_references(self, screen_id: str) -> List[Tuple[str, Dict]]:
-        """Find all references to a screen as a child in other screens."""
+    def _find_child_references(self, screen_id: str, deep: bool = True) -> List[Tuple[str, Dict]]:
+        """Find all references to a screen as a child in other screens.
+
+        With ``deep=False`` the returned dicts are the live child
+        references; callers that only inspect them can skip the
+        per-child deepcopy.
+        """
         references = []
         for parent_id, parent_data in self._screens.items():
-            children = parent_data.get('children', [])
-            for child in children[:]:  # Use slice copy to avoid modification during iteration
+            for child in parent_data.get('children', []):
                 if child.get('screen_id') == screen_id:
-                    references.append((parent_id, copy.deepcopy(child)))
+                    references.append(
+                        (parent_id, copy.deepcopy(child) if deep else child)
+                    )
         return references
     
     def _perform_add_child(self, parent_id: str, child_data: Dict[str, Any]) -> None:
         """Internal method to add a child to a screen."""
         if parent_id in self._screens:
             self._screens[parent_id].setdefault('children', []).append(child_data)
-    
+            self._child_index.setdefault(parent_id, {})[
+                child_data.get('instance_id')
+            ] = child_data
+
+    def _get_child(self, parent_id: str, instance_id: str) -> Optional[Dict[str, Any]]:
+        """Resolve a child dict by instance id, tolerating a stale index.
+
+        Some paths append to a screen's children list directly without
+        going through _perform_add_child; on an index miss, fall back to
+        scanning the list and back-fill the index entry.
+        """
+        child = self._child_index.get(parent_id, {}).get(instance_id)
+        if child is not None:
+            return child
+        screen = self._screens.get(parent_id)
+        if screen is None:
+            return None
+        for child in screen.get('children', []):
+            if child.get('instance_id') == instance_id:
+                self._child_index.setdefault(parent_id, {})[instance_id] = child
+                return child
+        return None
+
     def _perform_remove_child(self, parent_id: str, instance_id: str) -> None:
         """Internal method to remove a child from a screen."""
         if parent_id in self._screens:
-            children = self._screens[parent_id].get('children', [])
-            self._screens[parent_id]['children'] = [
-                child for child in children if child.get('instance_id') != instance_id
-            ]
-    
+            child = self._get_child(parent_id, instance_id)
+            if child is not None:
+                self._child_index.get(parent_id, {}).pop(instance_id, None)
+                try:
+                    self._screens[parent_id].get('children', []).remove(child)
+                except ValueError:
+                    pass
+
     def _perform_update_child_position(self, parent_id: str, instance_id: str, new_pos: Dict[str, int]) -> None:
         """Internal method to update a child's position."""
-        if parent_id in self._screens:
-            children = self._screens[parent_id].get('children', [])
-            for child in children:
-                if child.get('instance_id') == instance_id:
-                    child['position'] = new_pos
-                    break
-    
+        child = self._get_child(parent_id, instance_id)
+        if child is not None:
+            child['position'] = new_pos
+
     def _perform_update_child_properties(self, parent_id: str, instance_id: str, new_props: Dict[str, Any]) -> None:
         """Internal method to update a child's properties."""
-        if parent_id in self._screens:
-            children = self._screens[parent_id].get('children', [])
-            for child in children:
-                if child.get('instance_id') == instance_id:
-                    child.update(new_props)
-                    break
+        child = self._get_child(parent_id, instance_id)
+        if child is not None:
+            child.update(new_props)
     
+    @contextmanager
+    def batch_updates(self):
+        """Coalesce screen_modified emits within the block.
+
+        Bulk operations (e.g. a multi-child drag) call
+        :meth:`notify_screen_update` once per child; wrapping them in
+        this context manager emits once per modified screen instead.
+        """
+        if self._batching is not None:
+            # Nested batch: the outermost block flushes.
+            yield
+            return
+        self._batching = set()
+        try:
+            yield
+        finally:
+            pending = self._batching
+            self._batching = None
+            for screen_id in pending:
+                self.screen_modified.emit(screen_id)
+
     def notify_screen_update(self, screen_id: str) -> None:
         """Notify that a screen has been updated."""
-        self.screen_modified.emit(screen_id)
+        if self._batching is not None:
+            self._batching.add(screen_id)
+        else:
+            self.screen_modified.emit(screen_id)
 
 # Create a singleton instance for the application to use
 screen_service = ScreenService()
@@ -18,7 +18,16 @@ class CircleTool(BaseDrawingItem):
             "border_color": "#222222",
             "border_width": 2
         }
-    
+        self._rebuild_paint_tools()
+
+    def _rebuild_paint_tools(self):
+        """Build the brush and pen once from the current properties."""
+        self._brush = QBrush(QColor(self.properties["color"]))
+        self._pen = QPen(
+            QColor(self.properties["border_color"]),
+            self.properties["border_width"],
+        )
+
     def contentRect(self):
         """Return the rectangle occupied by the circle's content."""
         return QRectF(
@@ -32,11 +41,15 @@ class CircleTool(BaseDrawingItem):
         """
         Paint the circle.
         """
-        # Set up brush and pen
-        brush = QBrush(QColor(self.properties["color"]))
-        pen = QPen(QColor(self.properties["border_color"]), self.properties["border_width"])
-        
-        # Draw the circle
-        painter.setBrush(brush)
-        painter.setPen(pen)
+        painter.setBrush(self._brush)
+        painter.setPen(self._pen)
         painter.drawEllipse(self.contentRect())
+
+    def update_properties(self, props):
+        """
+        Update circle properties.
+        """
+        super().update_properties(props)
+        if any(key in props for key in ["color", "border_color", "border_width"]):
+            self._rebuild_paint_tools()
+            self.update()
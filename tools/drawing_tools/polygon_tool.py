@@ -4,6 +4,18 @@ from PyQt6.QtWidgets import QStyleOptionGraphicsItem, QWidget
 
 from components.screen.base_drawing_item import BaseDrawingItem
 
+
+def _min_corner(points):
+    """Return the top-left corner of the points' bounding box in one pass."""
+    min_x = min_y = None
+    for x, y in points:
+        if min_x is None or x < min_x:
+            min_x = x
+        if min_y is None or y < min_y:
+            min_y = y
+    return min_x, min_y
+
+
 class PolygonTool(BaseDrawingItem):
     """
     Polygon drawing tool with transform capabilities.
@@ -11,11 +23,11 @@ class PolygonTool(BaseDrawingItem):
     
     def __init__(self, points, color="#5a6270"):
         super().__init__()
-        # Calculate the bounding box of the points to set position
-        x_values = [p[0] for p in points]
-        y_values = [p[1] for p in points]
-        min_x, min_y = min(x_values), min(y_values)
-        
+        # Calculate the bounding box of the points to set position;
+        # a single pass avoids building intermediate coordinate lists.
+        min_x, min_y = _min_corner(points)
+
+
         # Set position to the top-left corner of the bounding box
         self.setPos(min_x, min_y)
         
@@ -28,36 +40,37 @@ class PolygonTool(BaseDrawingItem):
             "border_color": "#222222",
             "border_width": 2
         }
-    
-    def contentRect(self):
-        """Return the rectangle occupied by the polygon's content."""
+        self._rebuild_paint_tools()
+        self._rebuild_geometry()
+
+    def _rebuild_geometry(self):
+        """Cache the QPolygonF and bounding rect for the current points."""
         points = self.properties["points"]
-        if not points:
-            return QRectF(0, 0, 0, 0)
+        self._polygon = QPolygonF([QPointF(x, y) for x, y in points])
+        if points:
+            self._content_rect = self._polygon.boundingRect()
+        else:
+            self._content_rect = QRectF(0, 0, 0, 0)
 
-        x_values = [p[0] for p in points]
-        y_values = [p[1] for p in points]
-        
-        min_x, max_x = min(x_values), max(x_values)
-        min_y, max_y = min(y_values), max(y_values)
+    def _rebuild_paint_tools(self):
+        """Build the brush and pen once from the current properties."""
+        self._brush = QBrush(QColor(self.properties["color"]))
+        self._pen = QPen(
+            QColor(self.properties["border_color"]),
+            self.properties["border_width"],
+        )
 
-        return QRectF(min_x, min_y, max_x - min_x, max_y - min_y)
+    def contentRect(self):
+        """Return the cached rectangle occupied by the polygon's content."""
+        return self._content_rect
     
     def _paint_content(self, painter, option, widget=None):
         """
         Paint the polygon.
         """
-        # Create polygon from points
-        polygon = QPolygonF([QPointF(x, y) for x, y in self.properties["points"]])
-        
-        # Set up brush and pen
-        brush = QBrush(QColor(self.properties["color"]))
-        pen = QPen(QColor(self.properties["border_color"]), self.properties["border_width"])
-        
-        # Draw the polygon
-        painter.setBrush(brush)
-        painter.setPen(pen)
-        painter.drawPolygon(polygon)
+        painter.setBrush(self._brush)
+        painter.setPen(self._pen)
+        painter.drawPolygon(self._polygon)
     
     def update_properties(self, props):
         """
@@ -70,14 +83,20 @@ class PolygonTool(BaseDrawingItem):
             
             # If the points are in absolute coordinates, convert to relative
             if len(new_points) > 0 and isinstance(new_points[0], (list, tuple)) and len(new_points[0]) == 2:
-                x_values = [p[0] for p in new_points]
-                y_values = [p[1] for p in new_points]
-                min_x, min_y = min(x_values), min(y_values)
-                
+                min_x, min_y = _min_corner(new_points)
+
+
                 # Update position
                 self.setPos(min_x, min_y)
                 
                 # Convert to relative points
                 props["points"] = [(x - min_x, y - min_y) for x, y in new_points]
-        
+
         super().update_properties(props)
+        if "points" in props:
+            self.prepareGeometryChange()
+            self._rebuild_geometry()
+            self.update()
+        if any(key in props for key in ["color", "border_color", "border_width"]):
+            self._rebuild_paint_tools()
+            self.update()
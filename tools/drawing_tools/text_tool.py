@@ -21,14 +21,19 @@ class TextTool(BaseDrawingItem):
             "italic": False,
             "alignment": Qt.AlignmentFlag.AlignLeft
         }
+        # Font and metrics are cached; building a QFont and QFontMetrics
+        # per paint is measurably slow with many text items on screen.
+        self._font = None
+        self._metrics = None
         self._text_rect = self._calculate_text_rect()
-    
+
     def _calculate_text_rect(self):
         """
         Calculate the bounding rectangle of the text.
         """
-        font = self._create_font()
-        metrics = QFontMetrics(font)
+        if self._metrics is None:
+            self._metrics = QFontMetrics(self._create_font())
+        metrics = self._metrics
         text = self.properties["text"]
         
         # Calculate text width and height
@@ -41,12 +46,14 @@ class TextTool(BaseDrawingItem):
     
     def _create_font(self):
         """
-        Create a font based on the current properties.
+        Create (or return the cached) font for the current properties.
         """
-        font = QFont(self.properties["font_family"], self.properties["font_size"])
-        font.setBold(self.properties.get("bold", False))
-        font.setItalic(self.properties.get("italic", False))
-        return font
+        if self._font is None:
+            font = QFont(self.properties["font_family"], self.properties["font_size"])
+            font.setBold(self.properties.get("bold", False))
+            font.setItalic(self.properties.get("italic", False))
+            self._font = font
+        return self._font
     
     def contentRect(self):
         """Return the rectangle occupied by the text content."""
@@ -77,6 +84,9 @@ class TextTool(BaseDrawingItem):
             key in props
             for key in ["text", "font_size", "font_family", "bold", "italic"]
         ):
+            # Invalidate the cached font/metrics before re-measuring.
+            self._font = None
+            self._metrics = None
             self.prepareGeometryChange()
             self._text_rect = self._calculate_text_rect()
             self.update()
@@ -1,105 +1,272 @@
+import hashlib
 import os
 import logging
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
+# Project root, resolved once; realpath walks the path with lstat per
+# component, which is wasted work on every theme operation.
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+# CSS custom-property declarations, e.g. "--accent: #007acc;".
+# Compiled once at import instead of per parse_variables call.
+_VAR_DECL_RE = re.compile(r'--([a-zA-Z0-9\-_]+)\s*:\s*([^;]+);')
+
+# Files loaded ahead of the alphabetical rest; lower ranks sort first.
+_PRIORITY = {"global_fix.qss": 0}
+
+# Fully-resolved stylesheets keyed by theme name. Each entry stores the
+# (name, mtime_ns, size) fingerprint of the theme's .qss files alongside
+# the result, so editing any file invalidates the entry while repeat
+# theme switches become a dict lookup.
+_STYLESHEET_CACHE = {}
+
+
+# On-disk cache of fully-resolved themes so a cold application start
+# reads one file instead of re-processing every .qss in the theme.
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "hmi-designer", "styles")
+
+
+def _disk_cache_path(theme_name, fingerprint):
+    """Cache file path for one theme at one fingerprint."""
+    digest = hashlib.blake2b(
+        repr(fingerprint).encode("utf-8"), digest_size=16
+    ).hexdigest()
+    return os.path.join(_CACHE_DIR, f"{theme_name}-{digest}.qss")
+
+
+def _read_disk_cache(cache_path):
+    """Return the cached stylesheet, or None when absent/unreadable."""
+    try:
+        with open(cache_path, 'rb') as f:
+            return f.read().decode('utf-8')
+    except OSError:
+        return None
+
+
+def _write_disk_cache(cache_path, theme_name, stylesheet):
+    """Atomically write the cache file, dropping stale entries."""
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        # Drop entries for the same theme at older fingerprints.
+        stale_prefix = f"{theme_name}-"
+        final_name = os.path.basename(cache_path)
+        with os.scandir(_CACHE_DIR) as it:
+            for entry in it:
+                if entry.name.startswith(stale_prefix) and entry.name != final_name:
+                    os.unlink(entry.path)
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(stylesheet.encode('utf-8'))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"Could not write stylesheet cache: {e}")
+
+
+def _theme_fingerprint(theme_path):
+    """Fingerprint the .qss files of a theme directory for cache checks."""
+    entries = []
+    with os.scandir(theme_path) as it:
+        for entry in it:
+            # Cheap name check first; follow_symlinks=False answers
+            # is_file from the directory entry without an extra stat.
+            if entry.name.endswith(".qss") and entry.is_file(follow_symlinks=False):
+                st = entry.stat()
+                entries.append((entry.name, st.st_mtime_ns, st.st_size))
+    entries.sort()
+    return tuple(entries)
+
+# Sorted theme list per styles path, keyed by the directory's mtime:
+# adding or removing a theme bumps it, so the scan reruns exactly once
+# per mutation however often the theme switcher rebuilds.
+_THEMES_CACHE = {}
+
+
 def get_available_themes(styles_dir="styles"):
     """Scans the styles directory for theme subdirectories."""
     try:
-        base_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
-        styles_path = os.path.join(base_dir, styles_dir)
-        
-        if not os.path.isdir(styles_path):
+        styles_path = os.path.join(_BASE_DIR, styles_dir)
+
+        try:
+            dir_mtime = os.stat(styles_path).st_mtime_ns
+        except OSError:
             logger.debug(f"Styles directory not found: {styles_path}")
             return []
-        
-        themes = [d for d in os.listdir(styles_path) 
-                 if os.path.isdir(os.path.join(styles_path, d)) and d.strip()]
-        return sorted(themes)
+
+        cached = _THEMES_CACHE.get(styles_path)
+        if cached is not None and cached[0] == dir_mtime:
+            return cached[1]
+
+        # scandir reuses the directory-iteration metadata, so is_dir()
+        # avoids the per-entry stat that listdir + os.path.isdir costs.
+        with os.scandir(styles_path) as it:
+            themes = sorted(e.name for e in it if e.is_dir() and e.name.strip())
+        _THEMES_CACHE[styles_path] = (dir_mtime, themes)
+        return themes
     except Exception as e:
         logger.debug(f"Could not scan for themes: {e}")
         return []
 
+# Parsed variables keyed by path, fingerprinted by (mtime_ns, size) so
+# repeat theme loads skip the read and regex parse entirely.
+_VARS_CACHE = {}
+
+
 def parse_variables(variables_path):
     """Parse CSS variables from variables.qss file."""
+    try:
+        st = os.stat(variables_path)
+    except OSError:
+        return {}
+
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _VARS_CACHE.get(variables_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
     variables = {}
     try:
-        if not os.path.isfile(variables_path):
-            return variables
-            
-        with open(variables_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
+        with open(variables_path, 'rb') as f:
+            content = f.read().decode('utf-8')
+
         # Parse CSS custom properties
-        pattern = r'--([a-zA-Z0-9\-_]+)\s*:\s*([^;]+);'
-        matches = re.findall(pattern, content)
-        
+        matches = _VAR_DECL_RE.findall(content)
+
+        # Themes reuse a handful of values (the same colour dozens of
+        # times); interning dedupes the strings and makes the dict's
+        # hash/equality checks pointer comparisons.
         for var_name, var_value in matches:
-            variables[f'--{var_name}'] = var_value.strip()
-            
+            variables[sys.intern(f'--{var_name}')] = sys.intern(var_value.strip())
+
     except Exception as e:
         logger.debug(f"Could not parse variables: {e}")
-        
-    return variables
+        return variables
+
+    # Read-only view so callers cannot mutate the cached mapping.
+    result = MappingProxyType(variables)
+    _VARS_CACHE[variables_path] = (signature, result)
+    return result
+
+# Compiled var(--name1|--name2|...) alternations keyed by the variable
+# names they cover, shared by every file processed with the same set.
+_VAR_REF_RE_CACHE = {}
+
+
+def _var_ref_re(variables):
+    """Return one compiled pattern matching any var(--name) reference."""
+    key = frozenset(variables)
+    pattern = _VAR_REF_RE_CACHE.get(key)
+    if pattern is None:
+        # Longest-first so no name is shadowed by a prefix of itself.
+        names = sorted(variables, key=len, reverse=True)
+        pattern = _VAR_REF_RE_CACHE[key] = re.compile(
+            r'var\((' + '|'.join(re.escape(n) for n in names) + r')\)'
+        )
+    return pattern
+
 
 def replace_variables(content, variables):
     """Replace CSS variable references with actual values."""
     if not variables:
         return content
-        
-    processed = content
-    
-    # Replace var(--variable-name) with actual values
-    for var_name, var_value in variables.items():
-        pattern = re.escape(f'var({var_name})')
-        processed = re.sub(pattern, var_value, processed)
-        
-    return processed
+
+    # Files with no variable references (resets, plain selector files)
+    # skip the regex engine entirely on a C-level substring check.
+    if 'var(' not in content:
+        return content
+
+    # One pass over the content with a single alternation instead of one
+    # re.sub scan per variable.
+    return _var_ref_re(variables).sub(
+        lambda m: variables[m.group(1)], content
+    )
+
+def _load_one(file_path, variables):
+    """Read one .qss file and resolve its variable references."""
+    try:
+        # Binary read + one decode skips TextIOWrapper's incremental
+        # decoding and universal-newline translation.
+        with open(file_path, 'rb') as f:
+            content = f.read().decode('utf-8')
+        if content.strip():
+            return replace_variables(content, variables)
+    except Exception as e:
+        logger.debug(f"Could not process file {file_path}: {e}")
+    return None
+
 
 def load_all_stylesheets(theme_name, styles_dir="styles"):
     """Loads and processes all .qss files with CSS variable replacement."""
     if not theme_name or not theme_name.strip():
         return ""
 
-    full_stylesheet = ""
     try:
-        base_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
-        theme_path = os.path.join(base_dir, styles_dir, theme_name)
+        theme_path = os.path.join(_BASE_DIR, styles_dir, theme_name)
         
         if not os.path.isdir(theme_path):
             return ""
 
-        # Parse variables from variables.qss
-        variables_path = os.path.join(theme_path, "variables.qss")
-        variables = parse_variables(variables_path)
-        
-        # Load files alphabetically
-        files = sorted([f for f in os.listdir(theme_path) 
-                       if f.endswith(".qss") and os.path.isfile(os.path.join(theme_path, f))])
-
-        # Process priority files first
-        priority_files = ["global_fix.qss", "variables.qss"]
-        for priority_file in priority_files:
-            if priority_file in files:
-                files.remove(priority_file)
-                files.insert(0, priority_file)
-
-        # Skip variables.qss as it's already processed
-        files = [f for f in files if f != "variables.qss"]
-
-        for file_name in files:
-            full_path = os.path.join(theme_path, file_name)
-            try:
-                with open(full_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    if content.strip():
-                        processed_content = replace_variables(content, variables)
-                        full_stylesheet += processed_content + "\n"
-            except Exception as e:
-                logger.debug(f"Could not process file {file_name}: {e}")
-        
+        fingerprint = _theme_fingerprint(theme_path)
+        cached = _STYLESHEET_CACHE.get(theme_name)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        # Cold start: an on-disk copy for this fingerprint replaces the
+        # whole read-and-substitute pass with a single file read.
+        cache_path = _disk_cache_path(theme_name, fingerprint)
+        full_stylesheet = _read_disk_cache(cache_path)
+        if full_stylesheet is not None:
+            _STYLESHEET_CACHE[theme_name] = (fingerprint, full_stylesheet)
+            return full_stylesheet
+
+        # The scandir fingerprint above is the only directory walk:
+        # variables.qss is split out here for the variable parse and
+        # everything else becomes the load list, so there is no second
+        # listing or filter pass.
+        # Full paths are built once with a prefix concatenation instead
+        # of an os.path.join per file in the read loop.
+        prefix = theme_path + os.sep
+        has_variables = False
+        files = []
+        for name, _mtime, _size in fingerprint:
+            if name == "variables.qss":
+                has_variables = True
+            else:
+                files.append(name)
+        # One sort handles both ordering rules: priority files rank
+        # ahead of the rest, alphabetical within each rank.
+        files.sort(key=lambda name: (_PRIORITY.get(name, 1), name))
+
+        variables = {}
+        if has_variables:
+            variables = parse_variables(prefix + "variables.qss")
+
+        paths = [prefix + name for name in files]
+
+        # Read and substitute the files concurrently: the GIL is
+        # released during read() and inside the regex engine, so the
+        # per-file work overlaps. map() yields in submission order,
+        # keeping the output deterministic. Tiny themes stay sequential
+        # to skip the pool setup cost.
+        if len(paths) > 2:
+            with ThreadPoolExecutor(max_workers=min(8, len(paths))) as ex:
+                results = list(ex.map(
+                    lambda path: _load_one(path, variables), paths
+                ))
+        else:
+            results = [_load_one(path, variables) for path in paths]
+
+        # Collect the processed chunks and join once; += concatenation
+        # recopies all prior bytes on every file.
+        parts = [r for r in results if r is not None]
+        full_stylesheet = "\n".join(parts) + ("\n" if parts else "")
+        _STYLESHEET_CACHE[theme_name] = (fingerprint, full_stylesheet)
+        _write_disk_cache(cache_path, theme_name, full_stylesheet)
         return full_stylesheet
     except Exception as e:
         logger.debug(f"Could not load stylesheets: {e}")